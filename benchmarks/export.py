@@ -0,0 +1,31 @@
+"""Measure the throughput of exporting the Omer for 3,000 years in each format, serially and in parallel.
+
+Run with `python benchmarks/export.py`.
+"""
+
+import os
+import time
+from typing import Callable, TextIO
+
+from sefirat_haomer.export import CSV, ICS, JSONL, rows, write_parallel
+
+START_YEAR = 5000
+STOP_YEAR = 8000
+
+
+def measure(name: str, export: Callable[[TextIO], None]) -> None:
+    count = (STOP_YEAR - START_YEAR) * 49
+    with open(os.devnull, "w", newline="", encoding="utf-8") as f:
+        start = time.perf_counter()
+        export(f)
+        elapsed = time.perf_counter() - start
+    print(f"{name}: {count} rows in {elapsed:.2f}s ({count / elapsed:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    for name, output_format in (("csv", CSV), ("jsonl", JSONL), ("ics", ICS)):
+        measure(name, lambda f: output_format.write(rows(START_YEAR, STOP_YEAR), f))
+        measure(
+            f"{name} (parallel)",
+            lambda f: write_parallel(output_format, START_YEAR, STOP_YEAR, f),
+        )
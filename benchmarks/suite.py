@@ -0,0 +1,154 @@
+"""Benchmarks of every public hot path, with regression checks against saved baseline results.
+
+Run `python benchmarks/suite.py --save baseline.json` once to record a baseline on a machine, and `python benchmarks/suite.py --baseline baseline.json` later to compare against it. The comparison exits with status 1 if any benchmark is slower (or uses more memory) than its baseline by more than the threshold.
+
+Latencies are the best time per call over several repeats. Throughputs are reported as the time per item of a bulk operation. Memory is measured with `tracemalloc`.
+"""
+
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+from datetime import date, timedelta
+from typing import Callable
+
+from sefirat_haomer import OmerCalendar, OmerCalendarRange, OmerDate, anchors
+from sefirat_haomer.texts import HebrewText
+
+BULK_YEARS = range(5000, 6000)
+GREGORIAN_DATES = [date(2023, 1, 1) + timedelta(days=i) for i in range(365 * 10)]
+
+
+def latency(function: Callable[[], object], repeat: int) -> float:
+    """The best time in seconds of a single call to a function."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def throughput(function: Callable[[], int], repeat: int) -> float:
+    """The best time in seconds per item of a function which processes items in bulk and returns how many it processed."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = timeit.default_timer()
+        count = function()
+        best = min(best, (timeit.default_timer() - start) / count)
+    return best
+
+
+def filter_dates() -> int:
+    for _ in OmerDate.filter_gregorian(GREGORIAN_DATES):
+        pass
+    return len(GREGORIAN_DATES)
+
+
+def iterate_calendars() -> int:
+    for year in BULK_YEARS:
+        for _ in OmerCalendar(hebrew_year=year):
+            pass
+    return len(BULK_YEARS) * 49
+
+
+def memory_per_million() -> float:
+    """The number of bytes allocated by a million distinct OmerDates."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    dates = list(OmerCalendarRange(5000, 5000 + 1_000_000 // 49 + 1)[:1_000_000])
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del dates
+    return float(after - before)
+
+
+def run(repeat: int) -> dict[str, float]:
+    """Run every benchmark.
+
+    Returns:
+        A dict from the name of each benchmark to its result. Lower is better for every result.
+    """
+    anchors.precompute(BULK_YEARS.start, BULK_YEARS.stop)
+    gregorian_date = date(2023, 4, 14)
+    omer_date = OmerDate(8, hebrew_year=5783)
+    calendar = OmerCalendar(hebrew_year=5783)
+    text = HebrewText(33)
+    return {
+        "from_gregorian (s/call)": latency(
+            lambda: OmerDate.from_gregorian(gregorian_date), repeat
+        ),
+        "try_from_gregorian outside the Omer (s/call)": latency(
+            lambda: OmerDate.try_from_gregorian(GREGORIAN_DATES[0]), repeat
+        ),
+        "filter_gregorian (s/date)": throughput(filter_dates, repeat),
+        "OmerDate.gregorian (s/call)": latency(lambda: omer_date.gregorian, repeat),
+        "OmerDate.hebrew (s/call)": latency(lambda: omer_date.hebrew, repeat),
+        "OmerCalendar.__iter__ (s/call)": latency(lambda: list(calendar), repeat),
+        "OmerCalendar.__iter__ over many years (s/date)": throughput(
+            iterate_calendars, repeat
+        ),
+        "HebrewText.text (s/call)": latency(text.text, repeat),
+        "HebrewText(day).text() (s/call)": latency(
+            lambda: HebrewText(33).text(), repeat
+        ),
+        "memory per 10^6 OmerDates (bytes)": memory_per_million(),
+    }
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> bool:
+    """Print a comparison of results against a baseline.
+
+    Returns:
+        Whether every result is within the threshold of its baseline.
+    """
+    ok = True
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name}: {result:.3g} (no baseline)")
+            continue
+        change = result / baseline[name] - 1
+        regressed = change > threshold
+        ok = ok and not regressed
+        print(
+            f"{name}: {result:.3g} vs {baseline[name]:.3g} ({change:+.1%})"
+            + (" REGRESSION" if regressed else "")
+        )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", metavar="PATH", help="Save the results to a file.")
+    parser.add_argument(
+        "--baseline", metavar="PATH", help="Compare the results to a saved file."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="The relative slowdown which counts as a regression. Defaults to 0.2.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="The number of times to repeat each benchmark. Defaults to 5.",
+    )
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=4)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        return 0 if compare(results, baseline, args.threshold) else 1
+    for name, result in results.items():
+        print(f"{name}: {result:.3g}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
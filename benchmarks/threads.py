@@ -0,0 +1,63 @@
+"""Measure how the throughput of `OmerDate.from_gregorian` scales with the number of threads.
+
+Run with `python benchmarks/threads.py`. It measures with the OmerDate cache disabled and then enabled. Conversions share no locks in either case, so on a free-threaded build of CPython the throughput should grow almost linearly with the number of threads, up to the number of cores. With the GIL, threads take turns and the throughput stays about the same.
+"""
+
+import os
+import sys
+import threading
+import time
+from datetime import date, timedelta
+
+from sefirat_haomer import OmerDate
+
+CONVERSIONS_PER_THREAD = 200_000
+DATES = [date(2023, 4, 7) + timedelta(days=i % 49) for i in range(1000)]
+
+
+def convert() -> None:
+    from_gregorian = OmerDate.from_gregorian
+    for _ in range(CONVERSIONS_PER_THREAD // len(DATES)):
+        for gregorian_date in DATES:
+            from_gregorian(gregorian_date)
+
+
+def measure(threads: int) -> float:
+    """Get the number of conversions per second with the given number of threads."""
+    barrier = threading.Barrier(threads + 1)
+
+    def run() -> None:
+        barrier.wait()
+        convert()
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * CONVERSIONS_PER_THREAD / (time.perf_counter() - start)
+
+
+def report() -> None:
+    """Print the throughput with up to twice as many threads as there are CPUs."""
+    convert()  # Warm up.
+    baseline = measure(1)
+    threads = 1
+    while threads <= (os.cpu_count() or 1) * 2:
+        throughput = baseline if threads == 1 else measure(threads)
+        print(
+            f"{threads} threads: {throughput:,.0f} conversions/s ({throughput / baseline:.2f}x)"
+        )
+        threads *= 2
+
+
+if __name__ == "__main__":
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}, {os.cpu_count()} CPUs")
+    print("Without the OmerDate cache:")
+    report()
+    print("With the OmerDate cache:")
+    OmerDate.enable_cache()
+    report()
@@ -2,13 +2,28 @@
 .. include:: ../README.md
 """
 
-
-import importlib.metadata as metadata
-
-__version__ = metadata.version(__package__ or __name__)
-
 from .omer_calendar import OmerCalendar
+from .omer_calendar_range import OmerCalendarRange
 from .omer_date import OmerDate
+from .omer_date_array import OmerDateArray
 from .omer_day import OmerDay
+from .instrumentation import stats
+
+__all__ = (
+    "OmerCalendar",
+    "OmerCalendarRange",
+    "OmerDate",
+    "OmerDateArray",
+    "OmerDay",
+    "stats",
+)
+
+
+def __getattr__(name: str) -> str:
+    # The version is looked up on first access, since reading the package metadata is slower than importing the rest of the package.
+    if name == "__version__":
+        import importlib.metadata as metadata
 
-__all__ = ("OmerCalendar", "OmerDate", "OmerDay")
+        version = globals()["__version__"] = metadata.version(__name__)
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,263 @@
+"""The ordinal of 15 Nisan of each Hebrew year from 5000 to 6999.
+
+Generated by `tools/generate_anchors.py`. Do not edit.
+"""
+
+FIRST_YEAR = 5000
+"""The Hebrew year of the first element of `ORDINALS`."""
+
+# fmt: off
+ORDINALS = (
+    452641, 452995, 453350, 453735, 454089, 454472, 454827, 455181,
+    455564, 455919, 456273, 456658, 457011, 457366, 457750, 458105,
+    458488, 458842, 459197, 459582, 459935, 460289, 460674, 461029,
+    461412, 461766, 462121, 462506, 462860, 463213, 463598, 463952,
+    464307, 464690, 465044, 465429, 465782, 466136, 466521, 466876,
+    467229, 467613, 467968, 468351, 468706, 469060, 469445, 469800,
+    470154, 470537, 470892, 471246, 471629, 471984, 472369, 472723,
+    473076, 473461, 473815, 474170, 474553, 474907, 475292, 475645,
+    476000, 476384, 476739, 477092, 477476, 477831, 478186, 478569,
+    478923, 479308, 479663, 480017, 480400, 480755, 481109, 481492,
+    481847, 482232, 482586, 482939, 483324, 483678, 484033, 484416,
+    484770, 485125, 485510, 485863, 486247, 486602, 486957, 487340,
+    487694, 488049, 488432, 488786, 489171, 489526, 489880, 490263,
+    490618, 490972, 491357, 491710, 492064, 492449, 492804, 493187,
+    493541, 493896, 494279, 494633, 494988, 495373, 495726, 496110,
+    496465, 496820, 497203, 497557, 497912, 498297, 498651, 499004,
+    499389, 499743, 500126, 500481, 500835, 501220, 501573, 501928,
+    502312, 502667, 503050, 503404, 503759, 504142, 504497, 504851,
+    505236, 505591, 505945, 506328, 506683, 507066, 507420, 507775,
+    508160, 508514, 508867, 509252, 509606, 509989, 510344, 510698,
+    511083, 511436, 511791, 512175, 512530, 512883, 513267, 513622,
+    514007, 514360, 514714, 515099, 515454, 515808, 516191, 516546,
+    516929, 517283, 517638, 518023, 518377, 518730, 519115, 519469,
+    519824, 520207, 520561, 520946, 521301, 521654, 522038, 522393,
+    522748, 523131, 523485, 523870, 524223, 524577, 524962, 525317,
+    525671, 526054, 526409, 526763, 527148, 527501, 527886, 528240,
+    528595, 528978, 529332, 529687, 530070, 530425, 530809, 531164,
+    531517, 531901, 532256, 532611, 532994, 533348, 533703, 534088,
+    534442, 534825, 535180, 535534, 535917, 536272, 536626, 537011,
+    537364, 537749, 538103, 538458, 538841, 539195, 539550, 539933,
+    540288, 540642, 541027, 541380, 541764, 542119, 542474, 542857,
+    543211, 543566, 543951, 544305, 544688, 545043, 545397, 545780,
+    546135, 546489, 546874, 547227, 547582, 547966, 548321, 548704,
+    549058, 549413, 549798, 550151, 550505, 550890, 551245, 551628,
+    551982, 552337, 552722, 553076, 553429, 553814, 554168, 554523,
+    554906, 555260, 555645, 555998, 556352, 556737, 557092, 557445,
+    557829, 558184, 558567, 558922, 559276, 559661, 560016, 560370,
+    560753, 561108, 561462, 561845, 562200, 562585, 562939, 563292,
+    563677, 564031, 564386, 564769, 565123, 565508, 565861, 566216,
+    566600, 566955, 567308, 567692, 568047, 568402, 568785, 569139,
+    569524, 569879, 570233, 570616, 570971, 571325, 571708, 572063,
+    572448, 572802, 573155, 573540, 573894, 574249, 574632, 574986,
+    575341, 575724, 576079, 576463, 576818, 577171, 577555, 577910,
+    578265, 578648, 579002, 579387, 579742, 580096, 580479, 580834,
+    581188, 581573, 581926, 582280, 582665, 583020, 583403, 583757,
+    584112, 584495, 584849, 585204, 585589, 585942, 586326, 586681,
+    587036, 587419, 587773, 588128, 588513, 588867, 589220, 589605,
+    589959, 590342, 590697, 591051, 591436, 591789, 592143, 592528,
+    592883, 593266, 593620, 593975, 594358, 594713, 595067, 595452,
+    595807, 596161, 596544, 596899, 597282, 597636, 597991, 598376,
+    598730, 599083, 599468, 599822, 600205, 600560, 600914, 601299,
+    601652, 602007, 602391, 602746, 603099, 603483, 603838, 604223,
+    604576, 604930, 605315, 605670, 606024, 606407, 606762, 607145,
+    607499, 607854, 608239, 608593, 608946, 609331, 609685, 610040,
+    610423, 610777, 611162, 611517, 611870, 612254, 612609, 612964,
+    613347, 613701, 614086, 614439, 614793, 615178, 615533, 615887,
+    616270, 616625, 616979, 617364, 617717, 618102, 618456, 618811,
+    619194, 619548, 619903, 620286, 620641, 621025, 621380, 621733,
+    622117, 622472, 622827, 623210, 623564, 623919, 624304, 624658,
+    625041, 625396, 625750, 626133, 626488, 626842, 627227, 627580,
+    627965, 628319, 628674, 629057, 629411, 629766, 630149, 630504,
+    630858, 631243, 631596, 631980, 632335, 632690, 633073, 633427,
+    633782, 634167, 634521, 634904, 635259, 635613, 635996, 636351,
+    636705, 637090, 637443, 637798, 638182, 638537, 638920, 639274,
+    639629, 640014, 640367, 640721, 641106, 641461, 641844, 642198,
+    642553, 642936, 643290, 643645, 644030, 644384, 644737, 645122,
+    645476, 645861, 646214, 646568, 646953, 647308, 647661, 648045,
+    648400, 648783, 649138, 649492, 649877, 650232, 650586, 650969,
+    651324, 651678, 652061, 652416, 652801, 653155, 653508, 653893,
+    654247, 654602, 654985, 655339, 655724, 656077, 656432, 656816,
+    657171, 657524, 657908, 658263, 658618, 659001, 659355, 659740,
+    660095, 660449, 660832, 661187, 661541, 661924, 662279, 662664,
+    663018, 663371, 663756, 664110, 664465, 664848, 665202, 665557,
+    665940, 666295, 666679, 667034, 667387, 667771, 668126, 668481,
+    668864, 669218, 669603, 669958, 670312, 670695, 671050, 671404,
+    671789, 672142, 672496, 672881, 673236, 673619, 673973, 674328,
+    674711, 675065, 675420, 675805, 676158, 676542, 676897, 677252,
+    677635, 677989, 678344, 678729, 679083, 679436, 679821, 680175,
+    680558, 680913, 681267, 681652, 682005, 682359, 682744, 683099,
+    683482, 683836, 684191, 684574, 684929, 685283, 685668, 686023,
+    686377, 686760, 687115, 687498, 687852, 688207, 688592, 688946,
+    689299, 689684, 690038, 690421, 690776, 691130, 691515, 691868,
+    692223, 692607, 692962, 693315, 693699, 694054, 694437, 694792,
+    695146, 695531, 695886, 696240, 696623, 696978, 697361, 697715,
+    698070, 698455, 698809, 699162, 699547, 699901, 700256, 700639,
+    700993, 701378, 701733, 702086, 702470, 702825, 703180, 703563,
+    703917, 704302, 704655, 705009, 705394, 705749, 706103, 706486,
+    706841, 707195, 707580, 707933, 708318, 708672, 709027, 709410,
+    709764, 710119, 710502, 710856, 711241, 711596, 711949, 712333,
+    712688, 713043, 713426, 713780, 714135, 714520, 714874, 715257,
+    715612, 715966, 716349, 716704, 717058, 717443, 717796, 718181,
+    718535, 718890, 719273, 719627, 719982, 720365, 720720, 721074,
+    721459, 721812, 722196, 722551, 722906, 723289, 723643, 723998,
+    724383, 724737, 725120, 725475, 725829, 726212, 726567, 726921,
+    727306, 727659, 728014, 728398, 728753, 729136, 729490, 729845,
+    730230, 730583, 730937, 731322, 731677, 732060, 732414, 732769,
+    733152, 733506, 733861, 734246, 734600, 734953, 735338, 735692,
+    736077, 736430, 736784, 737169, 737524, 737877, 738261, 738616,
+    738999, 739354, 739708, 740093, 740448, 740802, 741185, 741540,
+    741894, 742277, 742632, 743017, 743371, 743724, 744109, 744463,
+    744818, 745201, 745555, 745940, 746293, 746648, 747032, 747387,
+    747740, 748124, 748479, 748834, 749217, 749571, 749956, 750311,
+    750665, 751048, 751403, 751757, 752140, 752495, 752880, 753234,
+    753587, 753972, 754326, 754681, 755064, 755418, 755773, 756156,
+    756511, 756895, 757250, 757603, 757987, 758342, 758697, 759080,
+    759434, 759819, 760174, 760528, 760911, 761266, 761620, 762003,
+    762358, 762712, 763097, 763450, 763835, 764189, 764544, 764927,
+    765281, 765636, 766021, 766374, 766758, 767113, 767468, 767851,
+    768205, 768560, 768945, 769299, 769652, 770037, 770391, 770774,
+    771129, 771483, 771868, 772221, 772575, 772960, 773315, 773698,
+    774052, 774407, 774790, 775145, 775499, 775884, 776239, 776593,
+    776976, 777331, 777714, 778068, 778423, 778808, 779162, 779515,
+    779900, 780254, 780637, 780992, 781346, 781731, 782084, 782439,
+    782823, 783178, 783531, 783915, 784270, 784653, 785008, 785362,
+    785747, 786102, 786456, 786839, 787194, 787577, 787931, 788286,
+    788671, 789025, 789378, 789763, 790117, 790472, 790855, 791209,
+    791594, 791947, 792302, 792686, 793041, 793394, 793778, 794133,
+    794518, 794871, 795225, 795610, 795965, 796319, 796702, 797057,
+    797411, 797796, 798149, 798534, 798888, 799243, 799626, 799980,
+    800335, 800718, 801072, 801457, 801812, 802165, 802549, 802904,
+    803259, 803642, 803996, 804351, 804736, 805090, 805473, 805828,
+    806182, 806565, 806920, 807274, 807659, 808012, 808397, 808751,
+    809106, 809489, 809843, 810198, 810581, 810936, 811290, 811675,
+    812028, 812412, 812767, 813122, 813505, 813859, 814214, 814599,
+    814953, 815336, 815691, 816045, 816428, 816783, 817137, 817522,
+    817875, 818230, 818614, 818969, 819352, 819706, 820061, 820446,
+    820799, 821153, 821538, 821893, 822276, 822630, 822985, 823368,
+    823722, 824077, 824462, 824816, 825169, 825554, 825908, 826293,
+    826646, 827000, 827385, 827740, 828093, 828477, 828832, 829215,
+    829569, 829924, 830309, 830662, 831016, 831401, 831756, 832110,
+    832493, 832848, 833233, 833587, 833940, 834325, 834679, 835034,
+    835417, 835771, 836156, 836509, 836864, 837248, 837603, 837956,
+    838340, 838695, 839050, 839433, 839787, 840172, 840527, 840881,
+    841264, 841619, 841973, 842356, 842711, 843096, 843450, 843803,
+    844188, 844542, 844897, 845280, 845634, 845989, 846372, 846727,
+    847111, 847466, 847819, 848203, 848558, 848913, 849296, 849650,
+    850035, 850390, 850744, 851127, 851482, 851836, 852219, 852574,
+    852928, 853313, 853666, 854051, 854405, 854760, 855143, 855497,
+    855852, 856237, 856590, 856974, 857329, 857684, 858067, 858421,
+    858776, 859159, 859513, 859868, 860253, 860607, 860990, 861345,
+    861699, 862084, 862437, 862791, 863176, 863531, 863914, 864268,
+    864623, 865006, 865361, 865715, 866100, 866455, 866809, 867192,
+    867547, 867930, 868284, 868639, 869024, 869378, 869731, 870116,
+    870470, 870853, 871208, 871562, 871947, 872300, 872655, 873039,
+    873394, 873747, 874131, 874486, 874869, 875224, 875578, 875963,
+    876318, 876672, 877055, 877410, 877793, 878147, 878502, 878887,
+    879241, 879594, 879979, 880333, 880688, 881071, 881425, 881810,
+    882163, 882518, 882902, 883257, 883610, 883994, 884349, 884734,
+    885087, 885441, 885826, 886181, 886535, 886918, 887273, 887627,
+    888012, 888365, 888750, 889104, 889459, 889842, 890196, 890551,
+    890934, 891288, 891673, 892028, 892381, 892765, 893120, 893475,
+    893858, 894212, 894567, 894952, 895306, 895689, 896044, 896398,
+    896781, 897136, 897490, 897875, 898228, 898613, 898967, 899322,
+    899705, 900059, 900414, 900797, 901152, 901506, 901891, 902244,
+    902628, 902983, 903338, 903721, 904075, 904430, 904815, 905169,
+    905552, 905907, 906261, 906644, 906999, 907353, 907738, 908091,
+    908446, 908830, 909185, 909568, 909922, 910277, 910660, 911015,
+    911369, 911754, 912107, 912491, 912846, 913201, 913584, 913938,
+    914293, 914678, 915032, 915385, 915770, 916124, 916509, 916862,
+    917216, 917601, 917956, 918309, 918693, 919048, 919431, 919785,
+    920140, 920525, 920878, 921232, 921617, 921972, 922326, 922709,
+    923064, 923449, 923803, 924156, 924541, 924895, 925250, 925633,
+    925987, 926372, 926725, 927079, 927464, 927819, 928172, 928556,
+    928911, 929266, 929649, 930003, 930388, 930743, 931097, 931480,
+    931835, 932189, 932572, 932927, 933312, 933666, 934019, 934404,
+    934758, 935113, 935496, 935850, 936205, 936588, 936943, 937327,
+    937682, 938035, 938419, 938774, 939129, 939512, 939866, 940251,
+    940606, 940960, 941343, 941698, 942052, 942435, 942790, 943144,
+    943529, 943882, 944267, 944621, 944976, 945359, 945713, 946068,
+    946453, 946806, 947190, 947545, 947900, 948283, 948637, 948992,
+    949375, 949729, 950084, 950469, 950823, 951206, 951561, 951915,
+    952300, 952653, 953007, 953392, 953747, 954130, 954484, 954839,
+    955222, 955577, 955931, 956316, 956671, 957025, 957408, 957763,
+    958146, 958500, 958855, 959240, 959594, 959947, 960332, 960686,
+    961069, 961424, 961778, 962163, 962516, 962871, 963255, 963610,
+    963963, 964347, 964702, 965085, 965440, 965794, 966179, 966534,
+    966888, 967271, 967626, 968009, 968363, 968718, 969103, 969457,
+    969810, 970195, 970549, 970904, 971287, 971641, 972026, 972379,
+    972734, 973118, 973473, 973826, 974210, 974565, 974950, 975303,
+    975657, 976042, 976397, 976751, 977134, 977489, 977843, 978226,
+    978581, 978966, 979320, 979673, 980058, 980412, 980767, 981150,
+    981504, 981889, 982244, 982597, 982981, 983336, 983691, 984074,
+    984428, 984783, 985168, 985522, 985905, 986260, 986614, 986997,
+    987352, 987706, 988091, 988444, 988829, 989183, 989538, 989921,
+    990275, 990630, 991013, 991368, 991722, 992107, 992460, 992844,
+    993199, 993554, 993937, 994291, 994646, 995031, 995385, 995768,
+    996123, 996477, 996860, 997215, 997569, 997954, 998307, 998662,
+    999046, 999401, 999784, 1000138, 1000493, 1000876, 1001231, 1001585,
+    1001970, 1002323, 1002707, 1003062, 1003417, 1003800, 1004154, 1004509,
+    1004894, 1005248, 1005601, 1005986, 1006340, 1006725, 1007078, 1007432,
+    1007817, 1008172, 1008525, 1008909, 1009264, 1009647, 1010001, 1010356,
+    1010741, 1011094, 1011448, 1011833, 1012188, 1012542, 1012925, 1013280,
+    1013665, 1014019, 1014372, 1014757, 1015111, 1015466, 1015849, 1016203,
+    1016588, 1016941, 1017295, 1017680, 1018035, 1018388, 1018772, 1019127,
+    1019482, 1019865, 1020219, 1020604, 1020959, 1021313, 1021696, 1022051,
+    1022405, 1022788, 1023143, 1023528, 1023882, 1024235, 1024620, 1024974,
+    1025329, 1025712, 1026066, 1026421, 1026804, 1027159, 1027543, 1027898,
+    1028251, 1028635, 1028990, 1029345, 1029728, 1030082, 1030467, 1030822,
+    1031176, 1031559, 1031914, 1032268, 1032651, 1033006, 1033360, 1033745,
+    1034098, 1034483, 1034837, 1035192, 1035575, 1035929, 1036284, 1036669,
+    1037022, 1037406, 1037761, 1038116, 1038499, 1038853, 1039208, 1039591,
+    1039945, 1040300, 1040685, 1041039, 1041422, 1041777, 1042131, 1042516,
+    1042869, 1043223, 1043608, 1043963, 1044346, 1044700, 1045055, 1045438,
+    1045792, 1046147, 1046532, 1046885, 1047239, 1047624, 1047979, 1048362,
+    1048716, 1049071, 1049456, 1049810, 1050163, 1050548, 1050902, 1051285,
+    1051640, 1051994, 1052379, 1052732, 1053087, 1053471, 1053826, 1054179,
+    1054563, 1054918, 1055301, 1055656, 1056010, 1056395, 1056750, 1057104,
+    1057487, 1057842, 1058225, 1058579, 1058934, 1059319, 1059673, 1060026,
+    1060411, 1060765, 1061120, 1061503, 1061857, 1062242, 1062595, 1062950,
+    1063334, 1063689, 1064042, 1064426, 1064781, 1065166, 1065519, 1065873,
+    1066258, 1066613, 1066967, 1067350, 1067705, 1068059, 1068442, 1068797,
+    1069182, 1069536, 1069889, 1070274, 1070628, 1070983, 1071366, 1071720,
+    1072105, 1072460, 1072813, 1073197, 1073552, 1073907, 1074290, 1074644,
+    1074999, 1075384, 1075738, 1076121, 1076476, 1076830, 1077213, 1077568,
+    1077922, 1078307, 1078660, 1079045, 1079399, 1079754, 1080137, 1080491,
+    1080846, 1081229, 1081584, 1081938, 1082323, 1082676, 1083060, 1083415,
+    1083770, 1084153, 1084507, 1084862, 1085247, 1085601, 1085984, 1086339,
+    1086693, 1087076, 1087431, 1087785, 1088170, 1088523, 1088878, 1089262,
+    1089617, 1090000, 1090354, 1090709, 1091092, 1091447, 1091801, 1092186,
+    1092539, 1092923, 1093278, 1093633, 1094016, 1094370, 1094725, 1095110,
+    1095464, 1095817, 1096202, 1096556, 1096939, 1097294, 1097648, 1098033,
+    1098386, 1098741, 1099125, 1099480, 1099863, 1100217, 1100572, 1100957,
+    1101310, 1101664, 1102049, 1102404, 1102758, 1103141, 1103496, 1103881,
+    1104235, 1104588, 1104973, 1105327, 1105682, 1106065, 1106419, 1106804,
+    1107157, 1107511, 1107896, 1108251, 1108604, 1108988, 1109343, 1109698,
+    1110081, 1110435, 1110820, 1111175, 1111529, 1111912, 1112267, 1112621,
+    1113004, 1113359, 1113744, 1114098, 1114451, 1114836, 1115190, 1115545,
+    1115928, 1116282, 1116637, 1117020, 1117375, 1117759, 1118114, 1118467,
+    1118851, 1119206, 1119561, 1119944, 1120298, 1120683, 1121038, 1121392,
+    1121775, 1122130, 1122484, 1122867, 1123222, 1123576, 1123961, 1124314,
+    1124699, 1125053, 1125408, 1125791, 1126145, 1126500, 1126883, 1127238,
+    1127622, 1127977, 1128330, 1128714, 1129069, 1129424, 1129807, 1130161,
+    1130516, 1130901, 1131255, 1131638, 1131993, 1132347, 1132732, 1133085,
+    1133439, 1133824, 1134179, 1134562, 1134916, 1135271, 1135654, 1136008,
+    1136363, 1136748, 1137101, 1137455, 1137840, 1138195, 1138578, 1138932,
+    1139287, 1139672, 1140026, 1140379, 1140764, 1141118, 1141501, 1141856,
+    1142210, 1142595, 1142948, 1143303, 1143687, 1144042, 1144395, 1144779,
+    1145134, 1145517, 1145872, 1146226, 1146611, 1146966, 1147320, 1147703,
+    1148058, 1148441, 1148795, 1149150, 1149535, 1149889, 1150242, 1150627,
+    1150981, 1151336, 1151719, 1152073, 1152458, 1152811, 1153166, 1153550,
+    1153905, 1154258, 1154642, 1154997, 1155382, 1155735, 1156089, 1156474,
+    1156829, 1157183, 1157566, 1157921, 1158275, 1158658, 1159013, 1159398,
+    1159752, 1160105, 1160490, 1160844, 1161199, 1161582, 1161936, 1162321,
+    1162676, 1163029, 1163413, 1163768, 1164123, 1164506, 1164860, 1165215,
+    1165598, 1165952, 1166337, 1166692, 1167046, 1167429, 1167784, 1168138,
+    1168523, 1168876, 1169261, 1169615, 1169970, 1170353, 1170707, 1171062,
+    1171445, 1171800, 1172154, 1172539, 1172892, 1173276, 1173631, 1173986,
+    1174369, 1174723, 1175078, 1175463, 1175817, 1176200, 1176555, 1176909,
+    1177292, 1177647, 1178001, 1178386, 1178739, 1179094, 1179478, 1179833,
+    1180216, 1180570, 1180925, 1181308, 1181663, 1182017, 1182402, 1182755,
+)
+"""The proleptic Gregorian ordinal of 15 Nisan of each year, starting from `FIRST_YEAR`."""
+# fmt: on
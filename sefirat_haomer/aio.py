@@ -0,0 +1,143 @@
+"""Resolve Omer counts from asyncio code without blocking the event loop.
+
+Converting a date of a year whose date of Pesach hasn't been computed yet requires pyluach's calendar arithmetic. `OmerService` runs that in an executor, merges concurrent lookups which need the same year, and computes all the years missed during one iteration of the event loop in a single executor call. Every other lookup is resolved immediately with integer arithmetic and the memoized texts.
+
+Example:
+    >>> import asyncio
+    >>> from datetime import date
+    >>> from sefirat_haomer.aio import OmerService
+    >>> asyncio.run(OmerService().resolve(date(2023, 4, 14), locale="en"))
+    Count(omer_date=OmerDate(8, hebrew_year=5783), text='Today are eight days of the Omer, which are one week and one day.')
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from datetime import date, datetime, tzinfo
+from typing import Iterable, NamedTuple
+
+from . import anchors
+from .omer_date import OmerDate
+from .texts import LOCALES
+
+
+class Count(NamedTuple):
+    """The Omer count of a date."""
+
+    omer_date: OmerDate
+    """The date of the Omer."""
+    text: str
+    """The text of the count in the requested locale."""
+
+
+class Lookup(NamedTuple):
+    """The arguments of a single call to `OmerService.resolve`."""
+
+    when: date
+    timezone: tzinfo | None = None
+    locale: str = "he"
+
+
+class OmerService:
+    """Resolves Omer counts for asyncio applications.
+
+    Args:
+        executor: The executor to compute the dates of Pesach in. Defaults to the event loop's default executor.
+    """
+
+    __slots__ = ("_executor", "_pending", "_batch")
+
+    def __init__(self, executor: Executor | None = None) -> None:
+        self._executor = executor
+        self._pending: dict[int, asyncio.Future[int]] = {}
+        self._batch: list[int] | None = None
+
+    async def resolve(
+        self, when: date, timezone: tzinfo | None = None, locale: str = "he"
+    ) -> Count | None:
+        """Get the Omer count of a date.
+
+        Args:
+            when: The date to resolve. If it is a datetime and `timezone` is given, it must be aware and is first converted to `timezone`.
+            timezone: The time zone in which to take the date of a datetime.
+            locale: The locale of the text, which must be a key of `sefirat_haomer.texts.LOCALES`.
+
+        Returns:
+            The Omer date and its text, or None if the date is not during the Omer.
+
+        Raises:
+            ValueError: If the locale is not known, or `timezone` is given with a naive datetime.
+        """
+        text_class = LOCALES.get(locale)
+        if text_class is None:
+            raise ValueError(f"Unknown locale {locale!r}")
+        if isinstance(when, datetime):
+            if timezone is not None:
+                if when.tzinfo is None or when.utcoffset() is None:
+                    raise ValueError(
+                        "The time must be timezone-aware to convert it to a time zone."
+                    )
+                when = when.astimezone(timezone)
+            when = when.date()
+        hebrew_year = when.year + 3760
+        pesach = anchors.cached_pesach_ordinal(hebrew_year)
+        if pesach is None:
+            pesach = await self._pesach_ordinal(hebrew_year)
+        day = when.toordinal() - pesach
+        if not 1 <= day <= 49:
+            return None
+        return Count(OmerDate._trusted(day, hebrew_year), text_class(day).text())
+
+    async def resolve_many(self, lookups: Iterable[Lookup]) -> list[Count | None]:
+        """Resolve many lookups concurrently.
+
+        Args:
+            lookups: The arguments of each call to `resolve`.
+
+        Returns:
+            The result of each lookup, in the same order.
+        """
+        return list(
+            await asyncio.gather(*(self.resolve(*lookup) for lookup in lookups))
+        )
+
+    async def _pesach_ordinal(self, hebrew_year: int) -> int:
+        """Compute the ordinal of 15 Nisan of a year in the executor, together with any other years missed in this iteration of the event loop."""
+        future = self._pending.get(hebrew_year)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[hebrew_year] = loop.create_future()
+            if self._batch is None:
+                self._batch = []
+                loop.call_soon(self._flush, loop)
+            self._batch.append(hebrew_year)
+        # Shielded so that a cancelled caller doesn't cancel the lookup for everyone else waiting on it.
+        return await asyncio.shield(future)
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        hebrew_years, self._batch = self._batch or [], None
+        try:
+            computation = loop.run_in_executor(self._executor, _compute, hebrew_years)
+        except Exception as error:
+            # Such as an executor which was shut down. Fail the waiters rather than leave them hanging.
+            for hebrew_year in hebrew_years:
+                self._pending.pop(hebrew_year).set_exception(error)
+            return
+        computation.add_done_callback(lambda done: self._resolve(hebrew_years, done))
+
+    def _resolve(
+        self, hebrew_years: list[int], done: "asyncio.Future[list[int]]"
+    ) -> None:
+        error = asyncio.CancelledError() if done.cancelled() else done.exception()
+        for i, hebrew_year in enumerate(hebrew_years):
+            future = self._pending.pop(hebrew_year)
+            if error is not None:
+                future.set_exception(error)
+                continue
+            ordinal = done.result()[i]
+            # The executor may have been a process pool, which filled a different cache.
+            anchors.store_pesach_ordinal(hebrew_year, ordinal)
+            future.set_result(ordinal)
+
+
+def _compute(hebrew_years: list[int]) -> list[int]:
+    return [anchors.pesach_ordinal(hebrew_year) for hebrew_year in hebrew_years]
@@ -0,0 +1,93 @@
+"""A year-indexed cache of the date of Pesach, which anchors every Omer date.
+
+The first day of the Omer is 16 Nisan, so the date of Omer day `n` of any year is simply the ordinal of 15 Nisan of that year plus `n`. Computing that ordinal requires pyluach's calendar arithmetic, so it is done at most once per year and kept here.
+
+The ordinals of a broad range of years are precomputed in `sefirat_haomer._anchor_table`, which is generated by `tools/generate_anchors.py`, and more can be loaded from a shared file with `sefirat_haomer.index.load`. Only years outside those ranges need calendar arithmetic.
+
+Ordinals are proleptic Gregorian ordinals, as used by `datetime.date.toordinal` and `datetime.date.fromordinal`. pyluach is only imported the first time an ordinal has to be computed.
+
+Lookups are safe from any number of threads without locking: the loaded index is replaced as a single immutable snapshot, and if several threads compute the same year at once, the first result stored is the one they all return.
+"""
+
+from typing import Sequence
+
+from ._anchor_table import FIRST_YEAR, ORDINALS
+
+JD_OFFSET = 1721424.5
+"""The difference between a Julian day at midnight (as used by pyluach) and the corresponding proleptic Gregorian ordinal."""
+
+_anchors: dict[int, int] = {}
+_TABLE_SIZE = len(ORDINALS)
+# The first Hebrew year and the ordinals of the loaded index file, replaced together so that readers never see a mismatched pair.
+_shared: tuple[int, Sequence[int]] = (0, ())
+
+
+def pesach_ordinal(hebrew_year: int) -> int:
+    """Get the ordinal of 15 Nisan of the given Hebrew year.
+
+    The result is read from the precomputed table or the loaded index file if the year is in either. Otherwise it is computed with pyluach the first time the year is requested and cached for subsequent calls.
+
+    Args:
+        hebrew_year: The Hebrew year.
+
+    Returns:
+        The proleptic Gregorian ordinal of 15 Nisan of that year. It may be less than 1 for years before the common era.
+    """
+    index = hebrew_year - FIRST_YEAR
+    if 0 <= index < _TABLE_SIZE:
+        return ORDINALS[index]
+    first_year, shared = _shared
+    index = hebrew_year - first_year
+    if 0 <= index < len(shared):
+        return shared[index]
+    try:
+        return _anchors[hebrew_year]
+    except KeyError:
+        from pyluach.dates import HebrewDate
+
+        ordinal = int(HebrewDate(hebrew_year, 1, 15).jd - JD_OFFSET)
+        return store_pesach_ordinal(hebrew_year, ordinal)
+
+
+def cached_pesach_ordinal(hebrew_year: int) -> int | None:
+    """Get the ordinal of 15 Nisan of the given Hebrew year only if it is precomputed, loaded or has already been computed.
+
+    Args:
+        hebrew_year: The Hebrew year.
+
+    Returns:
+        The proleptic Gregorian ordinal of 15 Nisan of that year, or None if it isn't cached.
+    """
+    index = hebrew_year - FIRST_YEAR
+    if 0 <= index < _TABLE_SIZE:
+        return ORDINALS[index]
+    first_year, shared = _shared
+    index = hebrew_year - first_year
+    if 0 <= index < len(shared):
+        return shared[index]
+    return _anchors.get(hebrew_year)
+
+
+def store_pesach_ordinal(hebrew_year: int, ordinal: int) -> int:
+    """Cache the ordinal of 15 Nisan of a Hebrew year which was computed elsewhere, such as in another process.
+
+    Args:
+        hebrew_year: The Hebrew year.
+        ordinal: The proleptic Gregorian ordinal of 15 Nisan of that year.
+
+    Returns:
+        The cached ordinal, which is the one stored first if the year was already cached.
+    """
+    return _anchors.setdefault(hebrew_year, ordinal)
+
+
+def precompute(start_year: int, stop_year: int) -> None:
+    """Fill the cache for a range of Hebrew years so that later lookups need no calendar arithmetic. Years in the precomputed table are skipped.
+
+    Args:
+        start_year: The first Hebrew year to compute (inclusive).
+        stop_year: The last Hebrew year to compute (exclusive).
+    """
+    for hebrew_year in range(start_year, stop_year):
+        if cached_pesach_ordinal(hebrew_year) is None:
+            pesach_ordinal(hebrew_year)
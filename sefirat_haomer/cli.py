@@ -0,0 +1,137 @@
+"""The `sefirat-haomer` command.
+
+Without arguments, it prints the count of today's date (or of tonight, with `--tonight`), and exits with status 1 if it is not during the Omer:
+
+    $ sefirat-haomer --date 2023-04-14 --locale en
+    Today are eight days of the Omer, which are one week and one day.
+
+With `--stdin`, it reads one ISO date per line and writes each date followed by its day of the Omer and its text, separated by tabs. Both fields are empty for dates which are not during the Omer:
+
+    $ printf '2023-04-14\\n2023-01-01\\n' | sefirat-haomer --stdin --locale en
+    2023-04-14	8	Today are eight days of the Omer, which are one week and one day.
+    2023-01-01
+
+Input is processed in batches of whatever is available on stdin, so long pipelines are converted quickly while each line written to an interactive pipe is still answered immediately.
+"""
+
+import argparse
+import os
+import sys
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import BinaryIO, Sequence
+
+from .omer_date import _omer_day
+from .texts import LOCALES, HebrewText
+
+BATCH_SIZE = 1 << 16
+"""The most bytes of input read at once in `--stdin` mode."""
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command.
+
+    Args:
+        argv: The command line arguments, excluding the program name. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        The exit status.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.stdin and args.tonight:
+        parser.error("--tonight is not supported with --stdin")
+    text_class = LOCALES[args.locale]
+    if issubclass(text_class, HebrewText):
+        table = text_class.render_all(args.laomer_at_end, args.vowels)
+    elif args.vowels:
+        parser.error("--vowels is only supported by Hebrew locales")
+    else:
+        table = text_class.render_all(args.laomer_at_end)
+    if args.stdin:
+        try:
+            _stream(table, sys.stdin.buffer, sys.stdout.buffer)
+        except ValueError as e:
+            print(f"{parser.prog}: error: {e}", file=sys.stderr)
+            return 2
+        except BrokenPipeError:
+            # The reader went away, such as `head` in a pipeline. Python would otherwise fail again flushing stdout at exit.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 1
+        return 0
+    day, _ = _omer_day(args.date + timedelta(days=args.tonight))
+    if not 1 <= day <= 49:
+        return 1
+    print(table[day - 1])
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="sefirat-haomer", description="Print the count of Sefirat HaOmer."
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--date",
+        type=date.fromisoformat,
+        default=date.today(),
+        help="the Gregorian date to count, in ISO format (default: today)",
+    )
+    mode.add_argument(
+        "--stdin",
+        action="store_true",
+        help="read one ISO date per line from stdin and write each with its day and text",
+    )
+    parser.add_argument(
+        "--tonight",
+        action="store_true",
+        help="count the night following the date, which belongs to the next day",
+    )
+    parser.add_argument(
+        "--locale", choices=LOCALES, default="he", help="the language of the text"
+    )
+    parser.add_argument(
+        "--vowels", action="store_true", help="include vowels in Hebrew texts"
+    )
+    parser.add_argument(
+        "--laomer-at-end",
+        action="store_true",
+        help='put "of the Omer" at the end of the text',
+    )
+    return parser
+
+
+def _stream(table: Sequence[str], stdin: BinaryIO, stdout: BinaryIO) -> None:
+    """Convert each line of dates on stdin to a line on stdout.
+
+    Raises:
+        ValueError: If a line is not an ISO date. Lines before it have already been written.
+    """
+    # Reads whatever is buffered (at least one byte) instead of waiting for a full batch.
+    read = getattr(stdin, "read1", stdin.read)
+
+    # Input typically repeats the same dates many times.
+    @lru_cache(maxsize=4096)
+    def convert(line: bytes) -> bytes:
+        text = line.decode().strip()
+        if not text:
+            return b""
+        day, _ = _omer_day(date.fromisoformat(text))
+        if not 1 <= day <= 49:
+            return f"{text}\t\t\n".encode()
+        return f"{text}\t{day}\t{table[day - 1]}\n".encode()
+
+    rest = b""
+    try:
+        while chunk := read(BATCH_SIZE):
+            *lines, rest = (rest + chunk).split(b"\n")
+            try:
+                stdout.write(b"".join(map(convert, lines)))
+            except ValueError:
+                # Write the lines of the batch before the invalid one, then raise the same error again.
+                stdout.writelines(map(convert, lines))
+                raise
+            stdout.flush()
+        stdout.write(convert(rest))
+    finally:
+        stdout.flush()
@@ -0,0 +1,33 @@
+"""Streaming export of the Omer over many years to CSV, JSON lines and iCalendar files.
+
+Rows are generated lazily and written in buffered chunks, so memory use does not grow with the number of years exported.
+
+Example:
+    >>> from sefirat_haomer.export import rows, write_csv
+    >>> with open("sefirat_haomer.csv", "w", newline="", encoding="utf-8") as f:
+    ...     write_csv(rows(5783, 6001), f)
+
+Large exports can be split across processes by blocks of years, producing identical output:
+    >>> from sefirat_haomer.export import CSV, write_parallel
+    >>> with open("sefirat_haomer.csv", "w", newline="", encoding="utf-8") as f:
+    ...     write_parallel(CSV, 5783, 9000, f, workers=8)
+"""
+
+from .parallel import write_parallel
+from .rows import Renderer, Row, hebrew, rows
+from .writers import CSV, ICS, JSONL, Format, write_csv, write_ics, write_jsonl
+
+__all__ = (
+    "CSV",
+    "Format",
+    "ICS",
+    "JSONL",
+    "Renderer",
+    "Row",
+    "hebrew",
+    "rows",
+    "write_csv",
+    "write_ics",
+    "write_jsonl",
+    "write_parallel",
+)
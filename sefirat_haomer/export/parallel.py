@@ -0,0 +1,53 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TextIO
+
+from .rows import Renderer, hebrew, rows
+from .writers import Format
+
+BLOCK_SIZE = 100
+"""The default number of years formatted by each task."""
+
+
+def write_parallel(
+    format: Format,
+    start_year: int,
+    stop_year: int,
+    file: TextIO,
+    *,
+    renderer: Renderer = hebrew,
+    workers: int | None = None,
+    block_size: int = BLOCK_SIZE,
+) -> None:
+    """Write a complete file for a range of years, formatting blocks of years in separate processes.
+
+    Blocks are written in order as they complete, so the output is identical to `format.write(rows(start_year, stop_year, renderer=renderer), file)`. Only a bounded number of formatted blocks are held in memory at once.
+
+    Args:
+        format: The format to write, such as `CSV`, `JSONL` or `ICS`.
+        start_year: The first Hebrew year to export (inclusive).
+        stop_year: The last Hebrew year to export (exclusive).
+        file: The file to write to.
+        renderer: A function which returns the description of each day. It must be picklable, so it can't be a lambda.
+        workers: The number of worker processes. Defaults to the number of processors.
+        block_size: The number of years formatted by each task.
+    """
+    workers = workers or os.cpu_count() or 1
+    file.write(format.header)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[str]] = deque()
+        for block_start in range(start_year, stop_year, block_size):
+            block_stop = min(block_start + block_size, stop_year)
+            pending.append(
+                executor.submit(_block, format, block_start, block_stop, renderer)
+            )
+            if len(pending) >= 2 * workers:
+                file.write(pending.popleft().result())
+        while pending:
+            file.write(pending.popleft().result())
+    file.write(format.footer)
+
+
+def _block(format: Format, start_year: int, stop_year: int, renderer: Renderer) -> str:
+    return format.body(rows(start_year, stop_year, renderer=renderer))
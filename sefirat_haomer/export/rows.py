@@ -0,0 +1,71 @@
+from datetime import date
+from typing import Callable, Iterator, NamedTuple
+
+from ..anchors import pesach_ordinal
+from ..omer_date import OmerDate
+from ..omer_day import OmerDay
+from ..texts import HebrewText
+
+Renderer = Callable[[OmerDay], str]
+"""A function which returns the text to describe a day of the Omer with."""
+
+
+class Row(NamedTuple):
+    """A single exported day of the Omer."""
+
+    omer_date: OmerDate
+    """The date of the Omer."""
+    gregorian: date
+    """The Gregorian date of the Omer."""
+    subject: str
+    """A short title for the day, such as `"Omer 8 (1 week and 1 day)"`."""
+    description: str
+    """The text of the count for the day, as returned by the renderer."""
+
+
+def hebrew(day: OmerDay) -> str:
+    """The default renderer, which describes each day with its Hebrew text without vowels."""
+    return HebrewText.render_all()[day.day - 1]
+
+
+def rows(
+    start_year: int, stop_year: int, *, renderer: Renderer = hebrew
+) -> Iterator[Row]:
+    """Generate a row for every day of the Omer in a range of years.
+
+    Rows are generated lazily, so any number of years can be exported in constant memory.
+
+    Args:
+        start_year: The first Hebrew year to export (inclusive).
+        stop_year: The last Hebrew year to export (exclusive).
+        renderer: A function which returns the description of each day.
+
+    Yields:
+        A row for each day, in chronological order.
+    """
+    descriptions = tuple(renderer(OmerDay(day)) for day in range(1, 50))
+    for hebrew_year in range(start_year, stop_year):
+        pesach = pesach_ordinal(hebrew_year)
+        for day in range(1, 50):
+            yield Row(
+                OmerDate._trusted(day, hebrew_year),
+                date.fromordinal(pesach + day),
+                _SUBJECTS[day - 1],
+                descriptions[day - 1],
+            )
+
+
+def _plural(count: int, unit: str) -> str:
+    return f"{count} {unit}" if count == 1 else f"{count} {unit}s"
+
+
+def _subject(day: OmerDay) -> str:
+    if not day.weeks:
+        return f"Omer {day.day}"
+    parts = [_plural(day.weeks, "week")]
+    if day.days:
+        parts.append(_plural(day.days, "day"))
+    return f"Omer {day.day} ({' and '.join(parts)})"
+
+
+_SUBJECTS = tuple(_subject(OmerDay(day)) for day in range(1, 50))
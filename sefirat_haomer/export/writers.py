@@ -0,0 +1,213 @@
+import csv
+import io
+import json
+from datetime import timedelta
+from itertools import islice
+from typing import Callable, Iterable, Iterator, TextIO
+
+from .rows import Row
+
+BUFFER_SIZE = 4096
+"""The default number of rows to format before each write to the output file."""
+
+CSV_HEADER = ("Subject", "Description", "Start Date", "All Day Event", "Private")
+"""The columns of exported CSV files, which can be imported into Google Calendar."""
+
+
+class Format:
+    """A file format which rows can be exported to.
+
+    The output of a file in this format is its header, followed by the formatted rows, followed by its footer. Rows can be formatted in separate batches and concatenated in order.
+
+    Args:
+        header: The text at the start of the file.
+        footer: The text at the end of the file.
+        body: A function which formats a batch of rows.
+    """
+
+    __slots__ = ("header", "footer", "_body")
+
+    def __init__(
+        self, header: str, footer: str, body: Callable[[Iterable[Row]], str]
+    ) -> None:
+        self.header = header
+        self.footer = footer
+        self._body = body
+
+    def body(self, rows: Iterable[Row]) -> str:
+        """Format a batch of rows.
+
+        Args:
+            rows: The rows to format.
+        """
+        return self._body(rows)
+
+    def write(
+        self, rows: Iterable[Row], file: TextIO, *, buffer_size: int = BUFFER_SIZE
+    ) -> None:
+        """Write a complete file in this format.
+
+        Args:
+            rows: The rows to write.
+            file: The file to write to.
+            buffer_size: The number of rows to format before each write to the file.
+        """
+        file.write(self.header)
+        for chunk in _chunks(rows, buffer_size):
+            file.write(self._body(chunk))
+        file.write(self.footer)
+
+
+def _csv_body(rows: Iterable[Row]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        (row.subject, row.description, row.gregorian.isoformat(), True, False)
+        for row in rows
+    )
+    return buffer.getvalue()
+
+
+def _jsonl_body(rows: Iterable[Row]) -> str:
+    return "".join(
+        json.dumps(
+            {
+                "hebrew_year": row.omer_date.hebrew_year,
+                "day": row.omer_date.day,
+                "date": row.gregorian.isoformat(),
+                "subject": row.subject,
+                "description": row.description,
+            },
+            ensure_ascii=False,
+        )
+        + "\n"
+        for row in rows
+    )
+
+
+def _ics_body(rows: Iterable[Row]) -> str:
+    return "".join(_ics_event(row) for row in rows)
+
+
+def _csv_header() -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(CSV_HEADER)
+    return buffer.getvalue()
+
+
+CSV = Format(_csv_header(), "", _csv_body)
+"""A CSV file which can be imported into Google Calendar.
+
+Files in this format should be opened with `newline=""`, as for any file written with the `csv` module.
+"""
+
+JSONL = Format("", "", _jsonl_body)
+"""JSON lines, one object per row.
+
+Each object has the keys `hebrew_year`, `day`, `date` (an ISO 8601 Gregorian date), `subject` and `description`.
+"""
+
+ICS = Format(
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//sefirat-haomer//Sefirat HaOmer//EN\r\n"
+    "CALSCALE:GREGORIAN\r\n",
+    "END:VCALENDAR\r\n",
+    _ics_body,
+)
+"""An iCalendar file with an all-day event for each row.
+
+Files in this format should be opened with `newline=""` so that the CRLF line endings required by iCalendar are preserved.
+"""
+
+
+def write_csv(
+    rows: Iterable[Row], file: TextIO, *, buffer_size: int = BUFFER_SIZE
+) -> None:
+    """Write rows as a CSV file which can be imported into Google Calendar.
+
+    The file should be opened with `newline=""`, as for any file written with the `csv` module.
+
+    Args:
+        rows: The rows to write.
+        file: The file to write to.
+        buffer_size: The number of rows to format before each write to the file.
+    """
+    CSV.write(rows, file, buffer_size=buffer_size)
+
+
+def write_jsonl(
+    rows: Iterable[Row], file: TextIO, *, buffer_size: int = BUFFER_SIZE
+) -> None:
+    """Write rows as JSON lines, one object per row.
+
+    Each object has the keys `hebrew_year`, `day`, `date` (an ISO 8601 Gregorian date), `subject` and `description`.
+
+    Args:
+        rows: The rows to write.
+        file: The file to write to.
+        buffer_size: The number of rows to format before each write to the file.
+    """
+    JSONL.write(rows, file, buffer_size=buffer_size)
+
+
+def write_ics(
+    rows: Iterable[Row], file: TextIO, *, buffer_size: int = BUFFER_SIZE
+) -> None:
+    """Write rows as an iCalendar file with an all-day event for each row.
+
+    The file should be opened with `newline=""` so that the CRLF line endings required by iCalendar are preserved.
+
+    Args:
+        rows: The rows to write.
+        file: The file to write to.
+        buffer_size: The number of rows to format before each write to the file.
+    """
+    ICS.write(rows, file, buffer_size=buffer_size)
+
+
+def _chunks(rows: Iterable[Row], size: int) -> Iterator[list[Row]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _ics_event(row: Row) -> str:
+    # Not strftime, which doesn't pad years before 1000 to 4 digits on every platform.
+    start = row.gregorian.isoformat().replace("-", "")
+    end = (row.gregorian + timedelta(days=1)).isoformat().replace("-", "")
+    return (
+        "BEGIN:VEVENT\r\n"
+        f"UID:omer-{row.omer_date.hebrew_year}-{row.omer_date.day}@sefirat-haomer\r\n"
+        f"DTSTAMP:{start}T000000Z\r\n"
+        f"DTSTART;VALUE=DATE:{start}\r\n"
+        f"DTEND;VALUE=DATE:{end}\r\n"
+        f"{_fold('SUMMARY:' + _escape(row.subject))}\r\n"
+        f"{_fold('DESCRIPTION:' + _escape(row.description))}\r\n"
+        "END:VEVENT\r\n"
+    )
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line so that no line is longer than 75 octets, as required by RFC 5545."""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    start, limit = 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Never split a multi-byte UTF-8 character.
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode())
+        start, limit = end, 74
+    return "\r\n ".join(parts)
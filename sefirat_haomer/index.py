@@ -0,0 +1,82 @@
+"""A binary index of the dates of Pesach which many processes can share through `mmap`.
+
+The years of the precomputed table in `sefirat_haomer.anchors` are always available, but every other year is computed with pyluach and cached separately by each process. Servers with many worker processes can instead `write` the years they need to an index file once and `load` it in each worker. The file is memory mapped, so every worker shares a single copy of it in the page cache, and looking up a year reads the ordinal at its offset in the file without any warm-up. `OmerDate.from_gregorian`, `OmerDate.gregorian` and everything else which needs the date of Pesach use the loaded index automatically.
+
+The file is a 12-byte header (`MAGIC`, the first Hebrew year and the number of years) followed by the ordinal of 15 Nisan of each year, all as little-endian 32-bit integers.
+
+Example:
+    >>> from sefirat_haomer import index
+    >>> index.write("omer.idx", 7000, 9000)  # Once, before starting the workers.
+    >>> index.load("omer.idx")  # In each worker.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Sequence
+
+from . import anchors
+
+MAGIC = b"OMER"
+"""The first 4 bytes of every index file."""
+
+_HEADER = struct.Struct("<4sii")
+
+
+def write(path: str | os.PathLike[str], start_year: int, stop_year: int) -> None:
+    """Write an index file of a range of Hebrew years.
+
+    Args:
+        path: The path of the file to write.
+        start_year: The first Hebrew year to include (inclusive).
+        stop_year: The last Hebrew year to include (exclusive).
+    """
+    ordinals = array(
+        "i", (anchors.pesach_ordinal(year) for year in range(start_year, stop_year))
+    )
+    if sys.byteorder == "big":
+        ordinals.byteswap()
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, start_year, len(ordinals)))
+        file.write(ordinals.tobytes())
+
+
+def load(path: str | os.PathLike[str]) -> None:
+    """Memory map an index file and use it for every later lookup of the years in it, replacing any previously loaded index.
+
+    The index is replaced atomically, so this is safe while other threads are converting dates. On big-endian machines the ordinals are copied into private memory instead of being shared.
+
+    Args:
+        path: The path of a file created by `write`.
+
+    Raises:
+        ValueError: If the file is not a valid index file.
+    """
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        magic, first_year, count = _HEADER.unpack_from(mapped)
+    except struct.error:
+        magic, first_year, count = b"", 0, 0
+    if magic != MAGIC or len(mapped) != _HEADER.size + 4 * count:
+        mapped.close()
+        raise ValueError(f"{os.fspath(path)!r} is not an Omer index file.")
+    ordinals: Sequence[int]
+    if sys.byteorder == "big":
+        ordinals = array("i", mapped[_HEADER.size :])
+        ordinals.byteswap()
+        mapped.close()
+    else:
+        # The view keeps the file mapped until it is no longer used.
+        ordinals = memoryview(mapped)[_HEADER.size :].cast("i")
+    anchors._shared = (first_year, ordinals)
+
+
+def unload() -> None:
+    """Stop using the loaded index file, if any.
+
+    The file is unmapped once no thread is reading from it anymore.
+    """
+    anchors._shared = (0, ())
@@ -0,0 +1,203 @@
+"""Opt-in instrumentation of the hot paths of the library.
+
+While enabled, every call to `OmerDate.from_gregorian`, `OmerDate.gregorian`, `OmerDate.hebrew` and `Text.text` is counted and timed, and whether it found what it needed in the library's caches is recorded. Enabling replaces those methods with instrumented versions and disabling restores the originals, so instrumentation costs nothing at all while disabled.
+
+The collected statistics are available with `sefirat_haomer.stats()`. Each timing can also be sent to a sink, such as a function which forwards it to a metrics client. The counters are updated without locking to keep contention out of the instrumented paths, so they may miss a few calls while many threads are converting at once.
+
+Example:
+    >>> import sefirat_haomer
+    >>> from datetime import date
+    >>> from sefirat_haomer import OmerDate, instrumentation
+    >>> instrumentation.enable()
+    >>> OmerDate.from_gregorian(date(2023, 4, 14))
+    OmerDate(8, hebrew_year=5783)
+    >>> sefirat_haomer.stats().operations["OmerDate.from_gregorian"].calls
+    1
+"""
+
+import sys
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable, NamedTuple
+
+from . import anchors, omer_date
+from .omer_date import OmerDate
+
+Sink = Callable[[str, float], None]
+"""A function which receives the name of each instrumented operation and its duration in seconds."""
+
+_BUCKETS = 64
+
+
+class OperationStats(NamedTuple):
+    """The statistics of an instrumented operation."""
+
+    calls: int
+    """The number of calls."""
+    total: float
+    """The total time spent in the calls, in seconds."""
+    histogram: tuple[int, ...]
+    """The number of calls by duration. Element `i` counts the calls which took from `2 ** (i - 1)` up to `2 ** i` nanoseconds."""
+
+
+class CacheStats(NamedTuple):
+    """The statistics of one of the library's caches."""
+
+    hits: int
+    """The number of lookups which were found in the cache."""
+    misses: int
+    """The number of lookups which had to be computed."""
+    size: int
+    """The number of entries in the cache."""
+
+
+class Stats(NamedTuple):
+    """A snapshot of the statistics collected by the instrumentation."""
+
+    enabled: bool
+    """Whether the instrumentation is currently enabled."""
+    operations: dict[str, OperationStats]
+    """The statistics of each instrumented operation, by name."""
+    caches: dict[str, CacheStats]
+    """The statistics of each cache, by name. Hits and misses of the `anchors` and `texts` caches are only counted by instrumented operations."""
+
+
+class _Operation:
+    __slots__ = ("calls", "total", "histogram")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = 0
+        self.histogram = [0] * _BUCKETS
+
+    def stats(self) -> OperationStats:
+        return OperationStats(self.calls, self.total / 1e9, tuple(self.histogram))
+
+
+_operations: dict[str, _Operation] = {}
+# The hits and misses of the caches which are only counted by instrumented operations.
+_cache_counts: dict[str, list[int]] = {"anchors": [0, 0], "texts": [0, 0]}
+_originals: dict[tuple[type, str], Any] = {}
+_sink: Sink | None = None
+
+
+def enable(sink: Sink | None = None) -> None:
+    """Start instrumenting the hot paths. If already enabled, only the sink is replaced.
+
+    Args:
+        sink: A function to call with the name and duration of each instrumented operation.
+    """
+    global _sink
+    _sink = sink
+    if _originals:
+        return
+    from .texts.text import Text
+
+    _patch(
+        OmerDate,
+        "from_gregorian",
+        lambda cls, gregorian_date: _count_anchor(gregorian_date.year + 3760),
+    )
+    _patch(OmerDate, "gregorian", lambda self: _count_anchor(self._hebrew_year))
+    _patch(OmerDate, "hebrew", lambda self: _count_anchor(self._hebrew_year))
+    _patch(Text, "text", _count_text)
+
+
+def disable() -> None:
+    """Stop instrumenting the hot paths. The statistics collected so far are kept."""
+    global _sink
+    _sink = None
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+
+
+def reset() -> None:
+    """Clear the statistics collected so far."""
+    _operations.clear()
+    for counts in _cache_counts.values():
+        counts[:] = [0, 0]
+    if omer_date._cache is not None:
+        omer_date._cache.hits = omer_date._cache.misses = 0
+
+
+def stats() -> Stats:
+    """Get a snapshot of the statistics collected so far."""
+    anchor_hits, anchor_misses = _cache_counts["anchors"]
+    text_hits, text_misses = _cache_counts["texts"]
+    lru = omer_date._cache
+    caches = {
+        "anchors": CacheStats(anchor_hits, anchor_misses, len(anchors._anchors)),
+        "texts": CacheStats(text_hits, text_misses, _text_tables()),
+        "omer_date": (
+            CacheStats(lru.hits, lru.misses, len(lru))
+            if lru is not None
+            else CacheStats(0, 0, 0)
+        ),
+    }
+    nightfall = sys.modules.get(f"{__package__}.nightfall")
+    if nightfall is not None:
+        info = nightfall.nightfall.cache_info()
+        caches["nightfall"] = CacheStats(info.hits, info.misses, info.currsize)
+    return Stats(
+        bool(_originals),
+        {name: operation.stats() for name, operation in _operations.items()},
+        caches,
+    )
+
+
+def _patch(cls: type, name: str, classify: Callable[..., None]) -> None:
+    """Replace a method or property of a class with a version which passes its arguments to `classify` to count cache hits, then times the original."""
+    original: Any = cls.__dict__[name]
+    _originals[cls, name] = original
+    qualified_name = f"{cls.__name__}.{name}"
+    operation = _operations.setdefault(qualified_name, _Operation())
+    # The function behind a property, a classmethod or a plain method.
+    function = getattr(original, "fget", None) or getattr(
+        original, "__func__", original
+    )
+
+    @wraps(function)
+    def instrumented(*args: Any, **kwargs: Any) -> Any:
+        classify(*args, **kwargs)
+        start = perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - start
+            operation.calls += 1
+            operation.total += elapsed
+            operation.histogram[min(elapsed.bit_length(), _BUCKETS - 1)] += 1
+            if _sink is not None:
+                _sink(qualified_name, elapsed / 1e9)
+
+    if isinstance(original, property):
+        setattr(cls, name, property(instrumented, doc=original.__doc__))
+    elif isinstance(original, classmethod):
+        setattr(cls, name, classmethod(instrumented))
+    else:
+        setattr(cls, name, instrumented)
+
+
+def _count_anchor(hebrew_year: int) -> None:
+    miss = anchors.cached_pesach_ordinal(hebrew_year) is None
+    _cache_counts["anchors"][1 if miss else 0] += 1
+
+
+def _count_text(text: Any) -> None:
+    cls = type(text)
+    miss = (text._options(), cls.NORMALIZATION) not in cls._tables
+    _cache_counts["texts"][1 if miss else 0] += 1
+
+
+def _text_tables() -> int:
+    """Count the rendered tables of texts of every Text class."""
+    module = sys.modules.get(f"{__package__}.texts.text")
+    if module is None:
+        return 0
+    classes, count = [module.Text], 0
+    while classes:
+        cls = classes.pop()
+        count += len(cls.__dict__.get("_tables", ()))
+        classes.extend(cls.__subclasses__())
+    return count
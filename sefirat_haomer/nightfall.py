@@ -0,0 +1,130 @@
+"""Find the current day of the Omer at a given place and time, taking into account that the count changes at nightfall rather than at midnight.
+
+Nightfall is computed with the sunrise equation, without any network access, and is accurate to within a few minutes away from the polar regions. The time of nightfall is cached per location and date.
+
+Example:
+    >>> from datetime import datetime
+    >>> from zoneinfo import ZoneInfo
+    >>> from sefirat_haomer.nightfall import Location, omer_date_at
+    >>> jerusalem = Location(31.778, 35.235)
+    >>> omer_date_at(datetime(2023, 4, 14, 18, tzinfo=ZoneInfo("Asia/Jerusalem")), jerusalem)
+    OmerDate(8, hebrew_year=5783)
+    >>> omer_date_at(datetime(2023, 4, 14, 21, tzinfo=ZoneInfo("Asia/Jerusalem")), jerusalem)
+    OmerDate(9, hebrew_year=5783)
+"""
+
+import math
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import NamedTuple
+
+from .omer_date import OmerDate
+
+SUNSET = 0.833
+"""The depression of the center of the sun below the horizon at sunset, in degrees, accounting for refraction and the radius of the sun."""
+
+TZEIT = 8.5
+"""The depression of the sun below the horizon at nightfall (tzeit hakochavim), in degrees."""
+
+_J2000 = datetime(2000, 1, 1, 12, tzinfo=timezone.utc)
+_J2000_ORDINAL = date(2000, 1, 1).toordinal()
+_OBLIQUITY = math.radians(23.4397)
+
+
+class Location(NamedTuple):
+    """A place on Earth."""
+
+    latitude: float
+    """Degrees north of the equator (negative for south)."""
+    longitude: float
+    """Degrees east of Greenwich (negative for west)."""
+    elevation: float = 0
+    """Meters above sea level. Only used when a correction for elevation is requested."""
+
+
+@lru_cache(maxsize=4096)
+def nightfall(
+    location: Location,
+    day: date,
+    depression: float = TZEIT,
+    *,
+    elevation_correction: bool = False,
+) -> datetime | None:
+    """Get the time of nightfall on a given date at a given location.
+
+    Results are cached per location, date, depression and elevation correction.
+
+    Args:
+        location: The location.
+        day: The local date.
+        depression: The depression of the sun below the horizon which counts as nightfall, in degrees. Use `SUNSET` for sunset.
+        elevation_correction: Whether to add the dip of the horizon seen from the elevation of the location to the depression. This is appropriate for sunset, but not for depressions which are defined relative to the sea-level horizon, such as `TZEIT`.
+
+    Returns:
+        The time of nightfall in UTC, or None if the sun doesn't get that far below the horizon that day.
+    """
+    # Days since noon on 1 January 2000 at the local mean solar noon of the date.
+    mean_noon = day.toordinal() - _J2000_ORDINAL - location.longitude / 360
+    anomaly = math.radians((357.5291 + 0.98560028 * mean_noon) % 360)
+    center = (
+        1.9148 * math.sin(anomaly)
+        + 0.02 * math.sin(2 * anomaly)
+        + 0.0003 * math.sin(3 * anomaly)
+    )
+    ecliptic_longitude = math.radians(
+        (math.degrees(anomaly) + center + 180 + 102.9372) % 360
+    )
+    transit = (
+        mean_noon
+        + 0.0053 * math.sin(anomaly)
+        - 0.0069 * math.sin(2 * ecliptic_longitude)
+    )
+    declination = math.asin(math.sin(ecliptic_longitude) * math.sin(_OBLIQUITY))
+    if elevation_correction:
+        # The horizon seen from above sea level dips, so the sun sets later.
+        depression += 2.076 * math.sqrt(max(location.elevation, 0)) / 60
+    altitude = math.radians(-depression)
+    latitude = math.radians(location.latitude)
+    cos_hour_angle = (
+        math.sin(altitude) - math.sin(latitude) * math.sin(declination)
+    ) / (math.cos(latitude) * math.cos(declination))
+    if not -1 <= cos_hour_angle <= 1:
+        return None
+    hour_angle = math.degrees(math.acos(cos_hour_angle))
+    return _J2000 + timedelta(days=transit + hour_angle / 360)
+
+
+def omer_date_at(
+    when: datetime,
+    location: Location,
+    depression: float = TZEIT,
+    *,
+    elevation_correction: bool = False,
+) -> OmerDate | None:
+    """Get the day of the Omer being counted at a given time and place.
+
+    The count of each day starts at nightfall of the previous Gregorian date. Where the sun doesn't reach the given depression on that date, the count changes at local solar midnight instead.
+
+    Args:
+        when: The time. Must be timezone-aware.
+        location: The location.
+        depression: The depression of the sun below the horizon which counts as nightfall, in degrees. Use `SUNSET` to count from sunset.
+        elevation_correction: Whether to correct the depression for the elevation of the location, as in `nightfall`.
+
+    Returns:
+        The Omer date, or None if it is not currently the Omer at that location.
+
+    Raises:
+        ValueError: If the time is not timezone-aware.
+    """
+    if when.tzinfo is None or when.utcoffset() is None:
+        raise ValueError("The time must be timezone-aware.")
+    utc = when.astimezone(timezone.utc)
+    # The local mean solar date, which starts at solar midnight at the location.
+    local_date = (utc + timedelta(hours=location.longitude / 15)).date()
+    transition = nightfall(
+        location, local_date, depression, elevation_correction=elevation_correction
+    )
+    if transition is not None and utc >= transition:
+        local_date += timedelta(days=1)
+    return OmerDate.try_from_gregorian(local_date)
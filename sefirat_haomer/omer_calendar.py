@@ -1,6 +1,10 @@
+from datetime import date
 from typing import Iterator, SupportsInt, overload
 
-from .omer_date import OmerDate, _hebrew_year
+from .omer_calendar_range import OmerCalendarRange
+from .omer_date import OmerDate, _hebrew_year, _omer_indices
+
+_DAYS = range(1, 50)
 
 
 class OmerCalendar:
@@ -27,26 +31,40 @@ class OmerCalendar:
         ...
 
     @overload
-    def __getitem__(self, day: slice) -> list[OmerDate]:
-        """Get a list of OmerDates for a given slice."""
+    def __getitem__(self, day: slice) -> OmerCalendarRange:
+        """Get a lazy view of the OmerDates for a given slice."""
         ...
 
-    def __getitem__(self, day: SupportsInt | slice) -> OmerDate | list[OmerDate]:
+    def __getitem__(self, day: SupportsInt | slice) -> OmerDate | OmerCalendarRange:
+        start = self._hebrew_year * 49
         if isinstance(day, slice):
-            return [self[i] for i in range(*day.indices(49))]
-        index = int(day)
-        return OmerDate(
-            index + 1 if index >= 0 else 50 + index, hebrew_year=self._hebrew_year
-        )
+            return OmerCalendarRange._from_indices(range(start, start + 49)[day])
+        return OmerDate._trusted(_DAYS[int(day)], self._hebrew_year)
 
     def __iter__(self) -> Iterator[OmerDate]:
         """Iterate over all the Omer dates in the calendar."""
-        return iter(self[i] for i in range(49))
+        hebrew_year = self._hebrew_year
+        return (OmerDate._trusted(day, hebrew_year) for day in _DAYS)
 
     def __len__(self) -> int:
         """The number of Omer dates in the calendar."""
         return 49
 
+    @staticmethod
+    def range_for(start: date, end: date) -> OmerCalendarRange:
+        """Get a lazy view of the Omer dates from one Gregorian date to another, spanning as many years as needed.
+
+        The view is computed directly from the dates of Pesach of the first and last years, however long the interval is.
+
+        Args:
+            start: The first Gregorian date of the interval (inclusive).
+            end: The last Gregorian date of the interval (inclusive).
+
+        Returns:
+            The Omer dates in the interval. It is empty if `end` is before `start`.
+        """
+        return OmerCalendarRange._from_indices(_omer_indices(start, end))
+
     @property
     def hebrew_year(self) -> int:
         """The Hebrew year of this Omer calendar."""
@@ -72,4 +90,4 @@ class OmerCalendar:
         return hash(self._hebrew_year)
 
     def __contains__(self, omer_date: OmerDate) -> bool:
-        return self._hebrew_year == omer_date.hebrew.year
+        return self._hebrew_year == omer_date.hebrew_year
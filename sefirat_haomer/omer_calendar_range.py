@@ -0,0 +1,118 @@
+from collections.abc import Sequence
+from datetime import date
+from typing import Any, Iterator, SupportsInt, overload
+
+from .omer_date import OmerDate, _MONTH_OFFSETS, _omer_day
+
+
+class OmerCalendarRange(Sequence[OmerDate]):
+    """A lazy sequence of the Omer dates of a range of years, in chronological order.
+
+    No Omer dates are created until they are accessed. Indexing, slicing, `len`, `in` and `index` all take constant time regardless of the number of years.
+
+    Args:
+        start_year: The first Hebrew year of the range (inclusive).
+        stop_year: The last Hebrew year of the range (exclusive).
+    """
+
+    __slots__ = ("_indices",)
+
+    def __init__(self, start_year: int, stop_year: int) -> None:
+        # Each Omer date is identified by the index hebrew_year * 49 + day - 1.
+        self._indices = range(start_year * 49, max(start_year, stop_year) * 49)
+
+    @classmethod
+    def _from_indices(cls, indices: range) -> "OmerCalendarRange":
+        self = cls.__new__(cls)
+        self._indices = indices
+        return self
+
+    @overload
+    def __getitem__(self, index: SupportsInt) -> OmerDate:
+        """Get the OmerDate at a given index."""
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "OmerCalendarRange":
+        """Get a lazy view of the OmerDates in a given slice."""
+        ...
+
+    def __getitem__(self, index: SupportsInt | slice) -> "OmerDate | OmerCalendarRange":
+        if isinstance(index, slice):
+            return self._from_indices(self._indices[index])
+        hebrew_year, day = divmod(self._indices[int(index)], 49)
+        return OmerDate._trusted(day + 1, hebrew_year)
+
+    def __iter__(self) -> Iterator[OmerDate]:
+        """Iterate over the Omer dates in the range."""
+        for index in self._indices:
+            hebrew_year, day = divmod(index, 49)
+            yield OmerDate._trusted(day + 1, hebrew_year)
+
+    def __len__(self) -> int:
+        """The number of Omer dates in the range."""
+        return len(self._indices)
+
+    def __contains__(self, value: object) -> bool:
+        """Check whether an OmerDate, a Gregorian date or a Hebrew date is in the range."""
+        index = _omer_index(value)
+        return index is not None and index in self._indices
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        """Get the index of an OmerDate, a Gregorian date or a Hebrew date in the range.
+
+        Args:
+            value: The date to find.
+            start: The index to start searching from.
+            stop: The index to stop searching at.
+
+        Raises:
+            ValueError: If the date is not in the range.
+        """
+        index = _omer_index(value)
+        indices = self._indices[start:stop]
+        if index is None or index not in indices:
+            raise ValueError(f"{value!r} is not in {self!r}")
+        return indices.index(index) + len(self._indices[:start])
+
+    def count(self, value: Any) -> int:
+        return int(value in self)
+
+    def __reversed__(self) -> Iterator[OmerDate]:
+        return iter(self[::-1])
+
+    def __repr__(self) -> str:
+        indices = self._indices
+        if indices.step == 1 and indices.start % 49 == 0 and len(indices) % 49 == 0:
+            return f"{type(self).__name__}({indices.start // 49}, {indices.stop // 49})"
+        if not indices:
+            return f"{type(self).__name__}(0, 0)"
+        return f"<{type(self).__name__} of {len(self)} dates from {self[0]!r} to {self[-1]!r}>"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, type(self)):
+            return self._indices == other._indices
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._indices)
+
+
+def _omer_index(value: object) -> int | None:
+    """Get the index which identifies the Omer date of an OmerDate, a Gregorian date or a Hebrew date.
+
+    Returns:
+        The index, or None if the value is not a date during the Omer.
+    """
+    if isinstance(value, OmerDate):
+        return value.hebrew_year * 49 + value.day - 1
+    if isinstance(value, date):
+        day, hebrew_year = _omer_day(value)
+    else:
+        from pyluach.dates import HebrewDate
+
+        if not isinstance(value, HebrewDate):
+            return None
+        offset = _MONTH_OFFSETS.get(value.month)
+        day, hebrew_year = (0 if offset is None else value.day + offset), value.year
+    return hebrew_year * 49 + day - 1 if 1 <= day <= 49 else None
@@ -1,11 +1,65 @@
+import threading
 from datetime import date
 from functools import total_ordering
-from typing import SupportsInt
-
-from pyluach.dates import HebrewDate
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, SupportsInt
 
+from .anchors import JD_OFFSET, pesach_ordinal
 from .omer_day import OmerDay
 
+if TYPE_CHECKING:
+    from pyluach.dates import HebrewDate
+
+# Nisan always has 30 days and Iyar always has 29, so each Omer day falls on the same Hebrew month and day every year.
+_MONTH_OFFSETS = {1: -15, 2: 15, 3: 44}
+_HEBREW_MONTH_DAYS = tuple(
+    (1, day + 15) if day <= 15 else (2, day - 15) if day <= 44 else (3, day - 44)
+    for day in range(1, 50)
+)
+
+
+class _LRUCache:
+    """An approximately least recently used cache of OmerDates, with a maximum size. It also counts its hits and misses.
+
+    The dates are kept in two generations of up to half the maximum size each. Dates in the recent generation are found by reading it without any lock, so the common case never contends between threads. Every other access holds `lock`: a date found in the old generation is moved to the recent one, new dates are added to the recent one, and once the recent generation is full it replaces the old one, evicting every date which wasn't used since. Hits are counted without locking, so a few may be missed while many threads construct dates at once.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "lock", "recent", "old")
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.recent: dict[tuple[int, int], "OmerDate"] = {}
+        self.old: dict[tuple[int, int], "OmerDate"] = {}
+
+    def __len__(self) -> int:
+        return len(self.recent) + len(self.old)
+
+    def add(self, key: tuple[int, int], new: "OmerDate") -> "OmerDate":
+        """Get the cached date with the given key, caching `new` if there is none."""
+        with self.lock:
+            # Another thread may have cached the same date in the meantime.
+            cached = self.recent.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            cached = self.old.pop(key, None)
+            if cached is None:
+                self.misses += 1
+                cached = new
+            else:
+                self.hits += 1
+            if len(self.recent) >= max(self.maxsize // 2, 1):
+                # Replaced rather than cleared, since other threads may be reading it without the lock.
+                self.old = self.recent if self.maxsize > 1 else {}
+                self.recent = {}
+            self.recent[key] = cached
+            return cached
+
+
+_cache: _LRUCache | None = None
+
 
 @total_ordering
 class OmerDate(OmerDay):
@@ -19,25 +73,89 @@ class OmerDate(OmerDay):
 
     __slots__ = "_hebrew_year"
 
-    def __init__(
-        self,
+    _hebrew_year: int
+
+    def __new__(
+        cls,
         day: SupportsInt,
         *,
         hebrew_year: int | None = None,
         gregorian_year: int | None = None,
-    ) -> None:
-        super().__init__(day)
-        self._hebrew_year = _hebrew_year(hebrew_year, gregorian_year)
+    ) -> "OmerDate":
+        year = _hebrew_year(hebrew_year, gregorian_year)
+        cache = _cache
+        if cache is None or cls is not OmerDate:
+            self = super().__new__(cls, day)
+            self._hebrew_year = year
+            return self
+        key = (year, int(day))
+        cached = cache.recent.get(key)
+        if cached is not None:
+            cache.hits += 1
+            return cached
+        # Created outside the lock, so that it is held as briefly as possible.
+        new = super().__new__(cls, day)
+        new._hebrew_year = year
+        return cache.add(key, new)
+
+    @classmethod
+    def _trusted(cls, day: int, hebrew_year: int) -> "OmerDate":
+        """Create an OmerDate from a day which is known to be between 1 and 49, skipping validation."""
+        if _cache is not None and cls is OmerDate:
+            return cls(day, hebrew_year=hebrew_year)
+        self = object.__new__(cls)
+        self._day = day
+        self._hebrew_year = hebrew_year
+        return self
+
+    def __reduce__(self) -> tuple[Callable[[int], "OmerDate"], tuple[int]]:
+        return type(self).from_int, (self.to_int(),)
+
+    def to_int(self) -> int:
+        """Encode this date as a single non-negative integer.
+
+        The encoding is `hebrew_year * 49 + day - 1`. It is stable across versions, sorts in chronological order, and fits in 4 bytes for any Hebrew year below 87,652,393.
+        """
+        return self._hebrew_year * 49 + self._day - 1
+
+    @classmethod
+    def from_int(cls, value: int) -> "OmerDate":
+        """Decode a date encoded with `to_int`.
+
+        Args:
+            value: The encoded date.
+        """
+        hebrew_year, day = divmod(value, 49)
+        return cls._trusted(day + 1, hebrew_year)
+
+    @staticmethod
+    def enable_cache(maxsize: int = 4096) -> None:
+        """Share OmerDate instances between constructions of the same date.
+
+        While enabled, constructing an OmerDate which was recently constructed returns the same instance instead of a new one. Up to `maxsize` dates are kept, evicting approximately the least recently used. Subclasses are not cached. The cache is safe to use from many threads, and dates used recently are found without taking any lock.
+
+        Args:
+            maxsize: The maximum number of instances to keep.
+        """
+        global _cache
+        _cache = _LRUCache(maxsize)
+
+    @staticmethod
+    def disable_cache() -> None:
+        """Stop sharing OmerDate instances and drop any instances that were kept."""
+        global _cache
+        _cache = None
 
     @classmethod
-    def from_hebrew(cls, hebrew_date: HebrewDate) -> "OmerDate":
+    def from_hebrew(cls, hebrew_date: "HebrewDate") -> "OmerDate":
         """Create an OmerDate from a HebrewDate.
 
         Args:
             hebrew_date: The Hebrew date to convert to an OmerDate.
         """
+        offset = _MONTH_OFFSETS.get(hebrew_date.month)
         return cls(
-            hebrew_date - HebrewDate(hebrew_date.year, 1, 15),
+            0 if offset is None else hebrew_date.day + offset,
             hebrew_year=hebrew_date.year,
         )
 
@@ -47,18 +165,88 @@ class OmerDate(OmerDay):
 
         Args:
             gregorian_date: The Gregorian date to convert to an OmerDate.
+
+        Raises:
+            ValueError: If the date is not during the Omer.
         """
-        return cls.from_hebrew(HebrewDate.from_pydate(gregorian_date))
+        day, hebrew_year = _omer_day(gregorian_date)
+        return cls(day, hebrew_year=hebrew_year)
+
+    @classmethod
+    def try_from_gregorian(cls, gregorian_date: date) -> "OmerDate | None":
+        """Create an OmerDate from a Gregorian date, or return None if the date is not during the Omer.
+
+        Args:
+            gregorian_date: The Gregorian date to convert to an OmerDate.
+        """
+        day, hebrew_year = _omer_day(gregorian_date)
+        if 1 <= day <= 49:
+            return cls._trusted(day, hebrew_year)
+        return None
+
+    @classmethod
+    def filter_gregorian(cls, gregorian_dates: Iterable[date]) -> Iterator["OmerDate"]:
+        """Convert the Gregorian dates which are during the Omer to OmerDates, skipping the rest.
+
+        Args:
+            gregorian_dates: The Gregorian dates to convert.
+
+        Yields:
+            An OmerDate for each of the given dates which is during the Omer, in the same order.
+        """
+        for gregorian_date in gregorian_dates:
+            day, hebrew_year = _omer_day(gregorian_date)
+            if 1 <= day <= 49:
+                yield cls._trusted(day, hebrew_year)
+
+    @classmethod
+    def between(cls, start: date, end: date) -> Iterator["OmerDate"]:
+        """Get the Omer dates from one Gregorian date to another.
+
+        The first and last matching dates are computed directly from the dates of Pesach, so the cost depends only on the number of dates yielded, however long the interval is.
+
+        Args:
+            start: The first Gregorian date of the interval (inclusive).
+            end: The last Gregorian date of the interval (inclusive).
+
+        Yields:
+            Each Omer date in the interval in chronological order. There are none if `end` is before `start`.
+        """
+        for index in _omer_indices(start, end):
+            hebrew_year, day = divmod(index, 49)
+            yield cls._trusted(day + 1, hebrew_year)
+
+    @staticmethod
+    def is_omer(gregorian_date: date) -> bool:
+        """Check whether a Gregorian date is during the Omer.
+
+        Args:
+            gregorian_date: The Gregorian date to check.
+        """
+        return 1 <= _omer_day(gregorian_date)[0] <= 49
+
+    @property
+    def hebrew_year(self) -> int:
+        """The Hebrew year of the Omer."""
+        return self._hebrew_year
 
     @property
-    def hebrew(self) -> HebrewDate:
+    def hebrew(self) -> "HebrewDate":
         """The Hebrew date of the Omer."""
-        return HebrewDate(self._hebrew_year, 1, 15) + self.day
+        month, day = _HEBREW_MONTH_DAYS[self.day - 1]
+        from pyluach.dates import HebrewDate
+
+        return HebrewDate(self._hebrew_year, month, day, self.ordinal + JD_OFFSET)
 
     @property
     def gregorian(self) -> date:
         """The Gregorian date of the Omer."""
-        return self.hebrew.to_pydate()
+        return date.fromordinal(self.ordinal)
+
+    @property
+    def ordinal(self) -> int:
+        """The proleptic Gregorian ordinal of the date of the Omer, as returned by `datetime.date.toordinal`."""
+        return pesach_ordinal(self._hebrew_year) + self.day
 
     def __str__(self) -> str:
         return f"{super().__str__()} of year {self._hebrew_year}"
@@ -80,6 +268,34 @@ class OmerDate(OmerDay):
         return NotImplemented
 
 
+def _omer_day(gregorian_date: date) -> tuple[int, int]:
+    """Get the would-be Omer day and Hebrew year of a Gregorian date.
+
+    Args:
+        gregorian_date: The Gregorian date.
+
+    Returns:
+        A tuple of the day and the Hebrew year. The day is only a valid Omer day (between 1 and 49) if the date is during the Omer.
+    """
+    # The Omer always falls in the spring of the Gregorian year corresponding to its Hebrew year.
+    hebrew_year = gregorian_date.year + 3760
+    return gregorian_date.toordinal() - pesach_ordinal(hebrew_year), hebrew_year
+
+
+def _omer_indices(start: date, end: date) -> range:
+    """Get the packed indices (`hebrew_year * 49 + day - 1`) of the Omer dates from one Gregorian date to another, inclusive.
+
+    Packed indices of consecutive Omer dates are consecutive even across years, so the result is a single range.
+    """
+    day, hebrew_year = _omer_day(start)
+    # Dates before the Omer start from its first day, and dates after it from the first day of the next year.
+    first = hebrew_year * 49 + min(max(day, 1), 50) - 1
+    day, hebrew_year = _omer_day(end)
+    # Dates before the Omer end at the last day of the previous year, and dates after it at its last day.
+    last = hebrew_year * 49 + min(max(day, 0), 49) - 1
+    return range(first, last + 1)
+
+
 def _hebrew_year(hebrew_year: int | None, gregorian_year: int | None) -> int:
     """Return the Hebrew year from either the Hebrew or Gregorian year.
 
@@ -0,0 +1,164 @@
+from array import array
+from collections.abc import Sequence
+from datetime import date
+from typing import Callable, Iterable, Iterator, SupportsInt, overload
+
+from .anchors import pesach_ordinal
+from .omer_date import OmerDate, _omer_day
+
+
+class OmerDateArray(Sequence[OmerDate]):
+    """A compact, immutable sequence of Omer dates.
+
+    Each date is stored as a single packed integer (`hebrew_year * 49 + day - 1`) in an `array`, taking 4 bytes instead of a whole OmerDate object. OmerDate objects are only created when elements are accessed. Since packed integers sort in chronological order, sorting, deduplication and set operations work on the integers directly.
+
+    Args:
+        omer_dates: The Omer dates to store.
+    """
+
+    __slots__ = ("_indices",)
+
+    _indices: "array[int] | memoryview"
+
+    def __init__(self, omer_dates: Iterable[OmerDate] = ()) -> None:
+        self._indices = array(
+            "i",
+            (
+                omer_date.hebrew_year * 49 + omer_date.day - 1
+                for omer_date in omer_dates
+            ),
+        )
+
+    @classmethod
+    def _from_indices(
+        cls, indices: "Iterable[int] | array[int] | memoryview"
+    ) -> "OmerDateArray":
+        """Create an array from packed integers. Arrays and memoryviews are used as is, without copying."""
+        self = cls.__new__(cls)
+        self._indices = (
+            indices if isinstance(indices, (array, memoryview)) else array("i", indices)
+        )
+        return self
+
+    @classmethod
+    def filter_gregorian(cls, gregorian_dates: Iterable[date]) -> "OmerDateArray":
+        """Create an array of the Gregorian dates which are during the Omer, skipping the rest.
+
+        Args:
+            gregorian_dates: The Gregorian dates to convert.
+        """
+        indices = array("i")
+        for gregorian_date in gregorian_dates:
+            day, hebrew_year = _omer_day(gregorian_date)
+            if 1 <= day <= 49:
+                indices.append(hebrew_year * 49 + day - 1)
+        return cls._from_indices(indices)
+
+    @overload
+    def __getitem__(self, index: SupportsInt) -> OmerDate:
+        """Get the OmerDate at a given index."""
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "OmerDateArray":
+        """Get an array of the OmerDates in a given slice."""
+        ...
+
+    def __getitem__(self, index: SupportsInt | slice) -> "OmerDate | OmerDateArray":
+        if isinstance(index, slice):
+            return self._from_indices(self._indices[index])
+        hebrew_year, day = divmod(self._indices[int(index)], 49)
+        return OmerDate._trusted(day + 1, hebrew_year)
+
+    def __iter__(self) -> Iterator[OmerDate]:
+        for index in self._indices:
+            hebrew_year, day = divmod(index, 49)
+            yield OmerDate._trusted(day + 1, hebrew_year)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __contains__(self, omer_date: object) -> bool:
+        if isinstance(omer_date, OmerDate):
+            return omer_date.hebrew_year * 49 + omer_date.day - 1 in self._indices
+        return False
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, type(self)):
+            return self._indices == other._indices
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __reduce__(
+        self,
+    ) -> "tuple[Callable[[array[int]], OmerDateArray], tuple[array[int]]]":
+        # Copied into an array, since memoryviews of unpacked buffers can't be pickled.
+        return type(self)._from_indices, (array("i", self._indices),)
+
+    @property
+    def day(self) -> "array[int]":
+        """An array of the day of the Omer of each date."""
+        return array("b", (index % 49 + 1 for index in self._indices))
+
+    @property
+    def weeks(self) -> "array[int]":
+        """An array of the number of complete weeks in the day of the Omer of each date."""
+        return array("b", ((index % 49 + 1) // 7 for index in self._indices))
+
+    @property
+    def days(self) -> "array[int]":
+        """An array of the number of days in the day of the Omer of each date that are not part of a complete week."""
+        return array("b", ((index % 49 + 1) % 7 for index in self._indices))
+
+    @property
+    def hebrew_year(self) -> "array[int]":
+        """An array of the Hebrew year of each date."""
+        return array("i", (index // 49 for index in self._indices))
+
+    @property
+    def ordinal(self) -> "array[int]":
+        """An array of the proleptic Gregorian ordinal of each date."""
+        return array(
+            "i",
+            (
+                pesach_ordinal(hebrew_year) + day + 1
+                for hebrew_year, day in (divmod(index, 49) for index in self._indices)
+            ),
+        )
+
+    @property
+    def gregorian(self) -> list[date]:
+        """A list of the Gregorian date of each date."""
+        return [date.fromordinal(ordinal) for ordinal in self.ordinal]
+
+    def sorted(self, *, reverse: bool = False) -> "OmerDateArray":
+        """Get a copy of this array in chronological order.
+
+        Args:
+            reverse: Whether to sort in reverse chronological order instead.
+        """
+        return self._from_indices(sorted(self._indices, reverse=reverse))
+
+    def unique(self) -> "OmerDateArray":
+        """Get the distinct dates of this array in chronological order."""
+        return self._from_indices(sorted(set(self._indices)))
+
+    def union(self, other: "OmerDateArray") -> "OmerDateArray":
+        """Get the distinct dates in either array, in chronological order."""
+        return self._from_indices(sorted(set(self._indices).union(other._indices)))
+
+    def intersection(self, other: "OmerDateArray") -> "OmerDateArray":
+        """Get the distinct dates in both arrays, in chronological order."""
+        return self._from_indices(
+            sorted(set(self._indices).intersection(other._indices))
+        )
+
+    def difference(self, other: "OmerDateArray") -> "OmerDateArray":
+        """Get the distinct dates in this array but not in the other, in chronological order."""
+        return self._from_indices(sorted(set(self._indices).difference(other._indices)))
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
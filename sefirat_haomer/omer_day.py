@@ -1,11 +1,18 @@
 from functools import total_ordering
-from typing import Iterator, SupportsInt
+from typing import TYPE_CHECKING, Any, Iterator, SupportsInt, TypeVar
+
+if TYPE_CHECKING:
+    from .sefirot import Sefirah
+
+T = TypeVar("T", bound="OmerDay")
 
 
 @total_ordering
 class OmerDay:
     """This class simply represents a day in the Omer count. Essentially it is just contains a number from 1 to 49.
 
+    There are only 49 distinct instances of this class, which are shared by every call to the constructor. Subclasses are not shared in this way.
+
     Args:
         day: The day of the Omer. Must be between 1 and 49.
 
@@ -15,16 +22,40 @@ class OmerDay:
 
     __slots__ = ("_day",)
 
-    def __init__(self, day: SupportsInt) -> None:
-        self._day = int(day)
-        if not 1 <= self._day <= 49:
+    _day: int
+
+    def __new__(cls: type[T], day: SupportsInt, *args: Any, **kwargs: Any) -> T:
+        number = int(day)
+        if cls is OmerDay:
+            try:
+                return _omer_days[number]  # type: ignore
+            except KeyError:
+                pass
+        if not 1 <= number <= 49:
             raise ValueError("Omer day must be between 1 and 49")
+        self = super().__new__(cls)
+        self._day = number
+        return self
+
+    def __init__(self, day: SupportsInt, *args: Any, **kwargs: Any) -> None:
+        # Everything is set up in __new__. This only remains so that subclasses can still call super().__init__(day).
+        pass
+
+    def __getnewargs__(self) -> tuple[int]:
+        return (self._day,)
 
     @property
     def day(self) -> int:
         """The day of the Omer."""
         return self._day
 
+    @property
+    def sefirah(self) -> "Sefirah":
+        """The kabbalistic attribute of this day, in Hebrew (with and without vowels), transliterated and in English."""
+        from .sefirot import SEFIROT
+
+        return SEFIROT[self._day - 1]
+
     @property
     def weeks(self) -> int:
         """The number of complete weeks in the total number of days."""
@@ -59,3 +90,12 @@ class OmerDay:
         if type(self) is type(other):
             return self.day < other.day  # type: ignore
         return NotImplemented
+
+
+def _make_omer_day(day: int) -> OmerDay:
+    omer_day = object.__new__(OmerDay)
+    omer_day._day = day
+    return omer_day
+
+
+_omer_days = {day: _make_omer_day(day) for day in range(1, 50)}
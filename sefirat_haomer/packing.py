@@ -0,0 +1,50 @@
+"""Compact binary serialization of many Omer dates at once.
+
+Each date is encoded with `OmerDate.to_int` as a 4-byte little-endian unsigned integer, so a buffer of dates is exactly 4 bytes per date and has no header.
+"""
+
+import sys
+from array import array
+from typing import Iterable
+
+from .omer_date import OmerDate
+from .omer_date_array import OmerDateArray
+
+WIDTH = 4
+"""The number of bytes per packed date."""
+
+
+def pack_many(omer_dates: Iterable[OmerDate]) -> bytes:
+    """Pack Omer dates into a buffer of 4 bytes per date.
+
+    Args:
+        omer_dates: The dates to pack. An OmerDateArray is packed without creating any OmerDate objects.
+    """
+    if isinstance(omer_dates, OmerDateArray):
+        packed = array("I", omer_dates._indices)
+    else:
+        packed = array("I", (omer_date.to_int() for omer_date in omer_dates))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_many(data: bytes | bytearray | memoryview) -> OmerDateArray:
+    """Unpack a buffer created by `pack_many`.
+
+    On little-endian machines the result is a view of the buffer itself, so nothing is copied and dates are only decoded when accessed. The buffer must not be modified while the result is in use.
+
+    Args:
+        data: The packed dates.
+
+    Raises:
+        ValueError: If the length of the buffer is not a multiple of 4 bytes.
+    """
+    view = memoryview(data).cast("B")
+    if len(view) % WIDTH:
+        raise ValueError(f"Packed dates must be a multiple of {WIDTH} bytes long.")
+    if sys.byteorder == "big":
+        unpacked = array("I", view.tobytes())
+        unpacked.byteswap()
+        return OmerDateArray._from_indices(unpacked)
+    return OmerDateArray._from_indices(view.cast("I"))
@@ -0,0 +1,68 @@
+"""The kabbalistic attribute (sefirah) of each day of the Omer.
+
+Each week of the Omer corresponds to one of the seven lower sefirot, as does each day within the week. Day 9, for example, is the second day of the second week, so its attribute is "Gevurah she'bi'Gevurah" (Might within Might).
+
+The attributes of all 49 days are built once, when this module is imported, and are available through `sefirat_haomer.OmerDay.sefirah`.
+"""
+
+from typing import NamedTuple
+
+from .texts.normalize import strip_niqqud
+
+
+class Sefirah(NamedTuple):
+    """The attribute of a day of the Omer in every supported form."""
+
+    hebrew: str
+    """The attribute in Hebrew without vowels, such as `"חסד שבגבורה"`."""
+    hebrew_vowels: str
+    """The attribute in Hebrew with vowels, such as `"חֶסֶד שֶׁבִּגְבוּרָה"`."""
+    transliteration: str
+    """The attribute in Hebrew written with Latin letters, such as `"Chesed she'bi'Gevurah"`."""
+    english: str
+    """The attribute translated to English, such as `"Kindness within Might"`."""
+
+
+# Each sefirah is listed with its name, then its name prefixed with "which is in" (the vowels of the prefix and of the first letter depend on the name).
+_HEBREW = (
+    ("חֶסֶד", "שֶׁבְּחֶסֶד"),
+    ("גְּבוּרָה", "שֶׁבִּגְבוּרָה"),
+    ("תִּפְאֶרֶת", "שֶׁבְּתִפְאֶרֶת"),
+    ("נֶצַח", "שֶׁבְּנֶצַח"),
+    ("הוֹד", "שֶׁבְּהוֹד"),
+    ("יְסוֹד", "שֶׁבִּיסוֹד"),
+    ("מַלְכוּת", "שֶׁבְּמַלְכוּת"),
+)
+_TRANSLITERATION = (
+    ("Chesed", "she'be'Chesed"),
+    ("Gevurah", "she'bi'Gevurah"),
+    ("Tiferet", "she'be'Tiferet"),
+    ("Netzach", "she'be'Netzach"),
+    ("Hod", "she'be'Hod"),
+    ("Yesod", "she'bi'Yesod"),
+    ("Malchut", "she'be'Malchut"),
+)
+_ENGLISH = (
+    "Kindness",
+    "Might",
+    "Beauty",
+    "Victory",
+    "Splendor",
+    "Foundation",
+    "Kingship",
+)
+
+
+def _sefirah(day: int) -> Sefirah:
+    week, day_of_week = divmod(day - 1, 7)
+    hebrew = f"{_HEBREW[day_of_week][0]} {_HEBREW[week][1]}"
+    return Sefirah(
+        strip_niqqud(hebrew),
+        hebrew,
+        f"{_TRANSLITERATION[day_of_week][0]} {_TRANSLITERATION[week][1]}",
+        f"{_ENGLISH[day_of_week]} within {_ENGLISH[week]}",
+    )
+
+
+SEFIROT = tuple(_sefirah(day) for day in range(1, 50))
+"""The attribute of each day of the Omer, with the first day at index 0."""
@@ -1,5 +1,21 @@
 from .english_text import EnglishText
 from .hebrew_text import HebrewText
+from .normalize import Normalization, strip_niqqud
 from .phonetic_hebrew_text import PhoneticHebrewText
+from .text import Text
 
-__all__ = ("EnglishText", "HebrewText", "PhoneticHebrewText")
+LOCALES: dict[str, type[Text]] = {
+    "he": HebrewText,
+    "en": EnglishText,
+    "he-Latn": PhoneticHebrewText,
+}
+"""The text class used for each locale. Additional locales can be registered by adding to this dict."""
+
+__all__ = (
+    "EnglishText",
+    "HebrewText",
+    "LOCALES",
+    "Normalization",
+    "PhoneticHebrewText",
+    "strip_niqqud",
+)
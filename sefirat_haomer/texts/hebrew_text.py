@@ -1,7 +1,8 @@
-import re
-from typing import SupportsInt
+from itertools import product
+from typing import Iterable, SupportsInt
 
-from .text import Text
+from .normalize import strip_niqqud
+from .text import Text, _select
 
 
 class HebrewText(Text):
@@ -73,8 +74,54 @@ class HebrewText(Text):
         super().__init__(day, laomer_at_end)
         self._vowels = vowels
 
-    def text(self) -> str:
-        text = super().text()
-        if not self._vowels:
-            text = re.sub(r"[\u0591-\u05BD\u05BF-\u05C2\u05C4-\u05C7]", "", text)
-        return text
+    @classmethod
+    def render_all(
+        cls, laomer_at_end: bool = False, vowels: bool = False
+    ) -> tuple[str, ...]:
+        """Get the texts of all the days of the Omer at once.
+
+        The texts are rendered the first time and the same tuple is returned afterwards.
+
+        Args:
+            laomer_at_end: If True, the word "לעמר" will be at the end of the texts.
+            vowels: Whether to include the vowels.
+
+        Returns:
+            The text of each day in order (first day at index 0).
+        """
+        return cls._table(laomer_at_end, vowels)
+
+    @classmethod
+    def render_many(
+        cls,
+        days: Iterable[SupportsInt],
+        laomer_at_end: bool = False,
+        vowels: bool = False,
+    ) -> list[str]:
+        """Get the texts of many days without creating an instance for each.
+
+        Args:
+            days: The days of the Omer count.
+            laomer_at_end: If True, the word "לעמר" will be at the end of the texts.
+            vowels: Whether to include the vowels.
+
+        Returns:
+            The text of each day, in the same order.
+
+        Raises:
+            ValueError: If any day is not between 1 and 49.
+        """
+        return _select(cls.render_all(laomer_at_end, vowels), days)
+
+    @classmethod
+    def prebuild(cls) -> None:
+        for laomer_at_end, vowels in product((False, True), repeat=2):
+            cls._table(laomer_at_end, vowels)
+
+    def _options(self) -> tuple[bool, ...]:
+        return (self._laomer_at_end, self._vowels)
+
+    @classmethod
+    def _render(cls, text: str, laomer_at_end: bool, vowels: bool = False) -> str:
+        text = super()._render(text, laomer_at_end)
+        return text if vowels else strip_niqqud(text)
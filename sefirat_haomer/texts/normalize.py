@@ -0,0 +1,55 @@
+"""Normalization of rendered texts.
+
+Every transformation here is done with precomputed `str.translate` tables, and is applied once per table of texts when it is rendered (see `Text.NORMALIZATION`), not each time a text is requested.
+"""
+
+import unicodedata
+from itertools import chain
+from typing import Literal, NamedTuple
+
+_NIQQUD = dict.fromkeys(
+    chain(range(0x0591, 0x05BE), range(0x05BF, 0x05C3), range(0x05C4, 0x05C8))
+)
+"""Maps the Hebrew vowel points and cantillation marks to None, leaving the maqaf (U+05BE) and sof pasuq (U+05C3) punctuation marks intact."""
+
+_FINAL_LETTERS = str.maketrans("ךםןףץ", "כמנפצ")
+
+RLI = "\u2067"
+"""The Unicode right-to-left isolate mark."""
+
+PDI = "\u2069"
+"""The Unicode pop directional isolate mark, which ends an `RLI`."""
+
+
+def strip_niqqud(text: str) -> str:
+    """Remove the vowels and cantillation marks from Hebrew text.
+
+    Args:
+        text: The text to strip.
+    """
+    return text.translate(_NIQQUD)
+
+
+class Normalization(NamedTuple):
+    """The normalization to apply to rendered texts. The default normalization leaves texts unchanged."""
+
+    form: Literal["NFC", "NFD"] | None = None
+    """The Unicode normalization form of the texts, or None to leave them as they are written."""
+    final_letters: bool = True
+    """Whether to keep the final forms of Hebrew letters (such as ם). If False, they are replaced by their regular forms (such as מ), as needed by some search indexes."""
+    rtl_marks: bool = False
+    """Whether to wrap each text in `RLI` and `PDI` marks, so that it is displayed right-to-left even when embedded in left-to-right text."""
+
+    def apply(self, text: str) -> str:
+        """Normalize a text.
+
+        Args:
+            text: The text to normalize.
+        """
+        if not self.final_letters:
+            text = text.translate(_FINAL_LETTERS)
+        if self.form is not None:
+            text = unicodedata.normalize(self.form, text)
+        if self.rtl_marks:
+            text = f"{RLI}{text}{PDI}"
+        return text
@@ -1,4 +1,10 @@
-from typing import Sequence, SupportsInt
+import threading
+from typing import Any, ClassVar, Iterable, Sequence, SupportsInt
+
+from .normalize import Normalization
+
+# Held while rendering a table, so that concurrent first uses of the same table render it only once.
+_render_lock = threading.Lock()
 
 
 class Text:
@@ -9,6 +15,7 @@ class Text:
     - `LAOMER` - The text to insert before the `PAUSE` or `END`. This should mean "of the omer" in the language of the text.
     - `PAUSE` - The text separating the total count from the weeks and days. Optional, defaults to `","`.
     - `END` - The text at the end of each text. Optional, defaults to `":"`.
+    - `NORMALIZATION` - The `Normalization` to apply to the rendered texts. Optional, defaults to leaving them unchanged. It may also be reassigned later, and texts are then rendered again with the new normalization.
 
     Args:
         day: The day of the Omer count.
@@ -19,9 +26,19 @@ class Text:
     LAOMER: str
     PAUSE: str = ","
     END: str = ":"
+    NORMALIZATION: Normalization = Normalization()
 
     __slots__ = ("day", "_laomer_at_end")
 
+    # Keyed by the options and the normalization, so that reassigning `NORMALIZATION` takes effect.
+    _tables: ClassVar[dict[tuple[tuple[bool, ...], Normalization], tuple[str, ...]]] = (
+        {}
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._tables = {}
+
     def __init__(self, day: SupportsInt, laomer_at_end: bool = False):
         self.day = int(day)
         self._laomer_at_end = laomer_at_end
@@ -33,6 +50,83 @@ class Text:
 
     def text(self) -> str:
         """Get the text of the Omer count for this day in Hebrew."""
-        text = self.TEXTS[self.day - 1]
-        char = self.END if self._laomer_at_end or self.PAUSE not in text else self.PAUSE
-        return text.replace(char, f" {self.LAOMER}{char}")
+        return self._table(*self._options())[self.day - 1]
+
+    @classmethod
+    def render_all(cls, laomer_at_end: bool = False) -> tuple[str, ...]:
+        """Get the texts of all the days of the Omer at once.
+
+        The texts are rendered the first time and the same tuple is returned afterwards.
+
+        Args:
+            laomer_at_end: Whether to put the `LAOMER` before the `END` always.
+
+        Returns:
+            The text of each day in order (first day at index 0).
+        """
+        return cls._table(laomer_at_end)
+
+    @classmethod
+    def render_many(
+        cls, days: Iterable[SupportsInt], laomer_at_end: bool = False
+    ) -> list[str]:
+        """Get the texts of many days without creating an instance for each.
+
+        Args:
+            days: The days of the Omer count.
+            laomer_at_end: Whether to put the `LAOMER` before the `END` always.
+
+        Returns:
+            The text of each day, in the same order.
+
+        Raises:
+            ValueError: If any day is not between 1 and 49.
+        """
+        return _select(cls.render_all(laomer_at_end), days)
+
+    @classmethod
+    def prebuild(cls) -> None:
+        """Render the texts of every day with every combination of options, so that no call to `text` has to render anything.
+
+        Texts are otherwise rendered the first time they are needed and reused afterwards.
+        """
+        for laomer_at_end in (False, True):
+            cls._table(laomer_at_end)
+
+    def _options(self) -> tuple[bool, ...]:
+        """The options of this instance, as accepted by `_table` and `_render`."""
+        return (self._laomer_at_end,)
+
+    @classmethod
+    def _table(cls, *options: bool) -> tuple[str, ...]:
+        """Get the rendered texts of all the days with the given options, rendering them the first time."""
+        key = (options, cls.NORMALIZATION)
+        try:
+            return cls._tables[key]
+        except KeyError:
+            pass
+        with _render_lock:
+            if key in cls._tables:
+                return cls._tables[key]
+            normalize = key[1].apply
+            table = tuple(normalize(cls._render(text, *options)) for text in cls.TEXTS)
+            cls._tables[key] = table
+            return table
+
+    @classmethod
+    def _render(cls, text: str, laomer_at_end: bool) -> str:
+        """Render the text of a single day with the given options."""
+        char = cls.END if laomer_at_end or cls.PAUSE not in text else cls.PAUSE
+        return text.replace(char, f" {cls.LAOMER}{char}")
+
+
+def _select(table: Sequence[str], days: Iterable[SupportsInt]) -> list[str]:
+    """Get the texts of the given days from a table of the texts of every day."""
+    texts = []
+    for day in days:
+        index = int(day) - 1
+        # Checked explicitly, since negative indices would silently wrap around.
+        if not 0 <= index < 49:
+            raise ValueError("Omer day must be between 1 and 49")
+        texts.append(table[index])
+    return texts
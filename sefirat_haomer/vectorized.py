@@ -0,0 +1,115 @@
+"""Vectorized conversions between arrays of Gregorian dates and Omer dates.
+
+This module requires numpy, which is not a dependency of this library and must be installed separately.
+
+Example:
+    >>> import numpy as np
+    >>> from sefirat_haomer import vectorized
+    >>> dates = np.array(["2023-04-14", "2023-01-01"], dtype="datetime64[D]")
+    >>> vectorized.from_gregorian(dates).day
+    array([8, 0], dtype=int8)
+"""
+
+from datetime import date
+from typing import NamedTuple
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as e:
+    raise ImportError(
+        "sefirat_haomer.vectorized requires numpy. Install it with `pip install numpy`."
+    ) from e
+
+from .anchors import pesach_ordinal
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class OmerArrays(NamedTuple):
+    """The Omer dates corresponding to an array of Gregorian dates.
+
+    Each array has the same shape as the input. Elements for dates which are not during the Omer are 0 in every array.
+    """
+
+    day: npt.NDArray[np.int8]
+    """The day of the Omer, from 1 to 49."""
+    hebrew_year: npt.NDArray[np.int32]
+    """The Hebrew year of the Omer."""
+    weeks: npt.NDArray[np.int8]
+    """The number of complete weeks in the day of the Omer."""
+    days: npt.NDArray[np.int8]
+    """The number of days in the day of the Omer that are not part of a complete week."""
+
+
+def _anchors(hebrew_years: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    """Get the date of 15 Nisan of each of the given years, as days since the Unix epoch.
+
+    Each distinct year is looked up once, however far apart the years are.
+
+    Args:
+        hebrew_years: The Hebrew years.
+
+    Returns:
+        An array of the same shape as `hebrew_years`.
+    """
+    years, inverse = np.unique(hebrew_years, return_inverse=True)
+    table = np.fromiter(
+        (pesach_ordinal(int(year)) for year in years),
+        dtype=np.int64,
+        count=years.size,
+    )
+    return (table - _EPOCH_ORDINAL)[inverse.reshape(hebrew_years.shape)]
+
+
+def from_gregorian(gregorian_dates: npt.ArrayLike) -> OmerArrays:
+    """Convert an array of Gregorian dates to Omer dates.
+
+    Args:
+        gregorian_dates: The dates to convert. They are converted to `datetime64[D]` if necessary. `NaT` is treated as a date outside the Omer.
+
+    Returns:
+        The Omer day, Hebrew year, weeks and days of each date.
+
+    Raises:
+        ValueError: If a date is too far in the future for its Hebrew year to fit in 32 bits.
+    """
+    dates = np.asarray(gregorian_dates, dtype="datetime64[D]")
+    valid = ~np.isnat(dates)
+    epoch_days = dates[valid].astype(np.int64)
+    # The Omer always falls in the spring of the Gregorian year corresponding to its Hebrew year.
+    hebrew_years = dates[valid].astype("datetime64[Y]").astype(np.int64) + 1970 + 3760
+    if hebrew_years.size and hebrew_years.max() > np.iinfo(np.int32).max:
+        raise ValueError("Hebrew years must fit in 32 bits")
+    omer_days = epoch_days - _anchors(hebrew_years)
+    in_omer = (omer_days >= 1) & (omer_days <= 49)
+
+    day = np.zeros(dates.shape, dtype=np.int8)
+    hebrew_year = np.zeros(dates.shape, dtype=np.int32)
+    day[valid] = np.where(in_omer, omer_days, 0)
+    hebrew_year[valid] = np.where(in_omer, hebrew_years, 0)
+    weeks, days = np.divmod(day, np.int8(7))
+    return OmerArrays(day, hebrew_year, weeks, days)
+
+
+def to_gregorian(
+    hebrew_years: npt.ArrayLike, days: npt.ArrayLike
+) -> npt.NDArray[np.datetime64]:
+    """Convert arrays of Hebrew years and Omer days to Gregorian dates.
+
+    Args:
+        hebrew_years: The Hebrew years of the Omer.
+        days: The days of the Omer. Must be between 1 and 49. Broadcast against `hebrew_years`.
+
+    Returns:
+        An array of `datetime64[D]` Gregorian dates.
+
+    Raises:
+        ValueError: If any day is not between 1 and 49.
+    """
+    years, omer_days = np.broadcast_arrays(
+        np.asarray(hebrew_years, dtype=np.int64), np.asarray(days, dtype=np.int64)
+    )
+    if np.any((omer_days < 1) | (omer_days > 49)):
+        raise ValueError("Omer day must be between 1 and 49")
+    return (_anchors(years) + omer_days).astype("datetime64[D]")
@@ -0,0 +1,105 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from sefirat_haomer import OmerDate, anchors
+from sefirat_haomer.aio import LOCALES, Count, Lookup, OmerService
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """A thread pool which records the arguments of every call submitted to it."""
+
+    def __init__(self) -> None:
+        super().__init__(max_workers=1)
+        self.calls: list[tuple] = []
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.calls.append(args)
+        return super().submit(fn, *args, **kwargs)
+
+
+def test_resolve():
+    """Test that a date is resolved to its Omer date and text."""
+    result = asyncio.run(OmerService().resolve(date(2023, 4, 14), locale="en"))
+    assert result == Count(
+        OmerDate(8, hebrew_year=5783),
+        "Today are eight days of the Omer, which are one week and one day.",
+    )
+
+
+def test_resolve_outside_omer():
+    """Test that a date outside the Omer resolves to None."""
+    assert asyncio.run(OmerService().resolve(date(2023, 1, 1))) is None
+
+
+def test_resolve_timezone():
+    """Test that an aware datetime is resolved in the requested time zone."""
+    when = datetime(2023, 4, 14, 22, tzinfo=timezone.utc)
+    service = OmerService()
+    in_utc = asyncio.run(service.resolve(when))
+    in_jerusalem = asyncio.run(service.resolve(when, timezone(timedelta(hours=3))))
+    assert in_utc is not None and in_utc.omer_date.day == 8
+    assert in_jerusalem is not None and in_jerusalem.omer_date.day == 9
+
+
+def test_resolve_naive_timezone():
+    """Test that a naive datetime is rejected when a time zone is given, rather than taken in the server's local time."""
+    with pytest.raises(ValueError):
+        asyncio.run(OmerService().resolve(datetime(2023, 4, 14, 22), timezone.utc))
+    result = asyncio.run(OmerService().resolve(datetime(2023, 4, 14, 22)))
+    assert result is not None and result.omer_date.day == 8
+
+
+def test_unknown_locale():
+    """Test that unknown locales are rejected."""
+    with pytest.raises(ValueError):
+        asyncio.run(OmerService().resolve(date(2023, 4, 14), locale="xx"))
+
+
+def test_resolve_many_batches_misses():
+    """Test that concurrent lookups of uncached years are merged into a single executor call."""
+    hebrew_years = (8160, 8161)
+    for hebrew_year in hebrew_years:
+        anchors._anchors.pop(hebrew_year, None)
+    executor = CountingExecutor()
+    service = OmerService(executor)
+    lookups = [
+        Lookup(date(hebrew_year - 3760, 5, day), None, locale)
+        for hebrew_year in hebrew_years
+        for day in range(1, 10)
+        for locale in ("he", "en", "he-Latn")
+    ]
+    with executor:
+        results = asyncio.run(service.resolve_many(lookups))
+    assert executor.calls == [([8160, 8161],)]
+    expected = [
+        (
+            None
+            if (omer_date := OmerDate.try_from_gregorian(lookup.when)) is None
+            else Count(omer_date, LOCALES[lookup.locale](omer_date).text())
+        )
+        for lookup in lookups
+    ]
+    assert results == expected
+    assert any(result is not None for result in results)
+    assert all(
+        anchors.cached_pesach_ordinal(hebrew_year) is not None
+        for hebrew_year in hebrew_years
+    )
+
+
+def test_executor_shut_down():
+    """Test that lookups fail rather than hang when the executor can't accept the computation."""
+    anchors._anchors.pop(8760, None)
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.shutdown()
+    service = OmerService(executor)
+
+    async def resolve():
+        return await asyncio.wait_for(service.resolve(date(5000, 5, 1)), 5)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(resolve())
+    assert not service._pending
@@ -0,0 +1,72 @@
+from datetime import date
+
+import pytest
+from pyluach.dates import HebrewDate
+
+from sefirat_haomer import OmerDate, anchors
+from sefirat_haomer._anchor_table import FIRST_YEAR, ORDINALS
+
+
+@pytest.mark.parametrize("hebrew_year", [3761, 5000, 5783, 5784, 6000, 9999])
+def test_pesach_ordinal(hebrew_year: int):
+    """Test that the cached anchor matches pyluach's date of 15 Nisan."""
+    expected = HebrewDate(hebrew_year, 1, 15).to_pydate().toordinal()
+    assert anchors.pesach_ordinal(hebrew_year) == expected
+    assert anchors.pesach_ordinal(hebrew_year) == expected
+
+
+def test_precompute():
+    """Test that precomputing a range outside the table fills the cache for every year in it."""
+    anchors.precompute(7100, 7110)
+    assert all(year in anchors._anchors for year in range(7100, 7110))
+
+
+def test_store_pesach_ordinal():
+    """Test that a stored ordinal is used by later lookups and doesn't replace one already cached."""
+    anchors._anchors.pop(7120, None)
+    expected = HebrewDate(7120, 1, 15).to_pydate().toordinal()
+    assert anchors.store_pesach_ordinal(7120, expected) == expected
+    assert anchors.store_pesach_ordinal(7120, expected + 1) == expected
+    assert anchors.cached_pesach_ordinal(7120) == expected
+
+
+def test_table_matches_pyluach():
+    """Test that every year of the precomputed table agrees with pyluach."""
+    for i, ordinal in enumerate(ORDINALS):
+        hebrew_year = FIRST_YEAR + i
+        assert ordinal == int(HebrewDate(hebrew_year, 1, 15).jd - anchors.JD_OFFSET)
+
+
+@pytest.mark.parametrize(
+    "hebrew_year, in_table",
+    [
+        (FIRST_YEAR - 1, False),
+        (FIRST_YEAR, True),
+        (FIRST_YEAR + len(ORDINALS) - 1, True),
+        (FIRST_YEAR + len(ORDINALS), False),
+    ],
+)
+def test_table_bounds(hebrew_year: int, in_table: bool):
+    """Test that years just outside the table fall back to pyluach."""
+    anchors._anchors.pop(hebrew_year, None)
+    assert (anchors.cached_pesach_ordinal(hebrew_year) is not None) == in_table
+    expected = HebrewDate(hebrew_year, 1, 15).to_pydate().toordinal()
+    assert anchors.pesach_ordinal(hebrew_year) == expected
+    assert anchors.cached_pesach_ordinal(hebrew_year) == expected
+
+
+@pytest.mark.parametrize("hebrew_year", [5782, 5783, 5784])
+def test_omer_dates_match_pyluach(hebrew_year: int):
+    """Test that every Omer date derived from the anchor agrees with pyluach's arithmetic."""
+    for day in range(1, 50):
+        omer_date = OmerDate(day, hebrew_year=hebrew_year)
+        expected = HebrewDate(hebrew_year, 1, 15) + day
+        assert omer_date.hebrew == expected
+        assert tuple(omer_date.hebrew) == tuple(expected)
+        assert omer_date.gregorian == expected.to_pydate()
+        assert omer_date.ordinal == expected.to_pydate().toordinal()
+
+
+def test_ordinal():
+    """Test that the ordinal of an OmerDate matches its Gregorian date."""
+    assert OmerDate(8, hebrew_year=5783).ordinal == date(2023, 4, 14).toordinal()
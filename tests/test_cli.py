@@ -0,0 +1,99 @@
+import io
+import subprocess
+import sys
+
+import pytest
+
+from sefirat_haomer.cli import main
+from sefirat_haomer.texts import EnglishText, HebrewText
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["--date", "2023-04-14"], HebrewText(8).text()),
+        (["--date", "2023-04-14", "--tonight"], HebrewText(9).text()),
+        (["--date", "2023-04-14", "--locale", "en"], EnglishText(8).text()),
+        (
+            ["--date", "2023-04-14", "--vowels", "--laomer-at-end"],
+            HebrewText(8, laomer_at_end=True, vowels=True).text(),
+        ),
+    ],
+)
+def test_date(argv, expected, capsys):
+    """Test that the count of a single date is printed."""
+    assert main(argv) == 0
+    assert capsys.readouterr().out == f"{expected}\n"
+
+
+def test_date_outside_omer(capsys):
+    """Test that nothing is printed for a date outside the Omer, with a non-zero status."""
+    assert main(["--date", "2023-01-01"]) == 1
+    assert capsys.readouterr().out == ""
+
+
+def test_vowels_not_hebrew():
+    """Test that vowels can't be requested for a non-Hebrew locale."""
+    with pytest.raises(SystemExit):
+        main(["--locale", "en", "--vowels"])
+
+
+def test_tonight_stdin():
+    """Test that --tonight is rejected rather than ignored for dates read from stdin."""
+    with pytest.raises(SystemExit):
+        main(["--stdin", "--tonight"])
+
+
+def test_stdin(monkeypatch, capsysbinary):
+    """Test that each line of input is converted, including the last one without a newline."""
+    monkeypatch.setattr(
+        sys,
+        "stdin",
+        io.TextIOWrapper(io.BytesIO(b"2023-04-14\n2023-01-01\r\n\n2023-04-14")),
+    )
+    assert main(["--stdin", "--locale", "en"]) == 0
+    text = EnglishText(8).text()
+    assert capsysbinary.readouterr().out.decode() == (
+        f"2023-04-14\t8\t{text}\n2023-01-01\t\t\n2023-04-14\t8\t{text}\n"
+    )
+
+
+def test_stdin_invalid(monkeypatch, capsysbinary):
+    """Test that the lines before an invalid one are written before failing."""
+    monkeypatch.setattr(
+        sys, "stdin", io.TextIOWrapper(io.BytesIO(b"2023-01-01\nnot a date\n"))
+    )
+    assert main(["--stdin"]) == 2
+    captured = capsysbinary.readouterr()
+    assert captured.out == b"2023-01-01\t\t\n"
+    assert b"not a date" in captured.err
+
+
+def test_stdin_broken_pipe(tmp_path):
+    """Test that the command exits quietly when the reader of its output closes the pipe early."""
+    path = tmp_path / "dates.txt"
+    path.write_bytes(b"2023-04-14\n" * 200_000)
+    with open(path, "rb") as stdin:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "sefirat_haomer", "--stdin"],
+            stdin=stdin,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        assert process.stdout is not None and process.stderr is not None
+        assert process.stdout.readline().startswith(b"2023-04-14\t8\t")
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        assert process.wait() == 1
+    assert stderr == b""
+
+
+def test_module():
+    """Test that the package can be run as a module."""
+    result = subprocess.run(
+        [sys.executable, "-m", "sefirat_haomer", "--date", "2023-04-14"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout == f"{HebrewText(8).text()}\n"
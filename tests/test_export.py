@@ -0,0 +1,113 @@
+import io
+import json
+from datetime import date
+
+import pytest
+
+from sefirat_haomer import OmerDate
+from sefirat_haomer.export import (
+    CSV,
+    ICS,
+    JSONL,
+    Format,
+    rows,
+    write_csv,
+    write_ics,
+    write_jsonl,
+    write_parallel,
+)
+from sefirat_haomer.texts import EnglishText
+
+
+def test_rows():
+    """Test that rows cover every day of every year in order."""
+    exported = list(rows(5783, 5785))
+    assert len(exported) == 98
+    assert exported[0].omer_date == OmerDate(1, hebrew_year=5783)
+    assert exported[-1].omer_date == OmerDate(49, hebrew_year=5784)
+    assert all(row.gregorian == row.omer_date.gregorian for row in exported)
+
+
+@pytest.mark.parametrize(
+    "day, subject",
+    [
+        (1, "Omer 1"),
+        (7, "Omer 7 (1 week)"),
+        (8, "Omer 8 (1 week and 1 day)"),
+        (16, "Omer 16 (2 weeks and 2 days)"),
+        (49, "Omer 49 (7 weeks)"),
+    ],
+)
+def test_subject(day: int, subject: str):
+    """Test that subjects are pluralised correctly."""
+    assert list(rows(5783, 5784))[day - 1].subject == subject
+
+
+def test_renderer():
+    """Test that a custom renderer is used for descriptions."""
+    row = next(rows(5783, 5784, renderer=lambda day: EnglishText(day).text()))
+    assert row.description == "Today is one day of the Omer."
+
+
+@pytest.mark.parametrize("buffer_size", [1, 10, 4096])
+def test_write_csv(buffer_size: int):
+    """Test that the CSV output is the same regardless of buffering."""
+    file = io.StringIO(newline="")
+    write_csv(rows(5783, 5784), file, buffer_size=buffer_size)
+    lines = file.getvalue().split("\r\n")
+    assert lines[0] == "Subject,Description,Start Date,All Day Event,Private"
+    assert lines[8] == (
+        'Omer 8 (1 week and 1 day),"היום שמונה ימים לעמר, שהם שבוע אחד ויום אחד:",'
+        "2023-04-14,True,False"
+    )
+    assert len(lines) == 51
+
+
+def test_write_jsonl():
+    """Test that each row is written as one JSON object."""
+    file = io.StringIO()
+    write_jsonl(rows(5783, 5784), file, buffer_size=7)
+    objects = [json.loads(line) for line in file.getvalue().splitlines()]
+    assert len(objects) == 49
+    assert objects[7] == {
+        "hebrew_year": 5783,
+        "day": 8,
+        "date": "2023-04-14",
+        "subject": "Omer 8 (1 week and 1 day)",
+        "description": "היום שמונה ימים לעמר, שהם שבוע אחד ויום אחד:",
+    }
+
+
+def test_write_ics():
+    """Test that the iCalendar output is well formed."""
+    file = io.StringIO(newline="")
+    write_ics(rows(5783, 5784), file)
+    content = file.getvalue()
+    lines = content.split("\r\n")
+    assert lines[0] == "BEGIN:VCALENDAR"
+    assert lines[-2:] == ["END:VCALENDAR", ""]
+    assert content.count("BEGIN:VEVENT") == 49
+    assert "DTSTART;VALUE=DATE:20230414\r\nDTEND;VALUE=DATE:20230415" in content
+    assert all(len(line.encode()) <= 75 for line in lines)
+    unfolded = content.replace("\r\n ", "")
+    assert "DESCRIPTION:היום שמונה ימים לעמר\\, שהם שבוע אחד ויום אחד:" in unfolded
+    assert date(2023, 4, 14).strftime("%Y%m%d") in content
+
+
+def test_write_ics_early_year():
+    """Test that dates before the year 1000 still have 8 digits."""
+    file = io.StringIO(newline="")
+    write_ics(rows(4700, 4701), file)
+    content = file.getvalue()
+    assert "DTSTART;VALUE=DATE:09400401\r\nDTEND;VALUE=DATE:09400402" in content
+    assert "DTSTAMP:09400401T000000Z" in content
+
+
+@pytest.mark.parametrize("output_format", [CSV, JSONL, ICS])
+def test_write_parallel(output_format: Format):
+    """Test that the parallel export is identical to the serial one."""
+    serial = io.StringIO(newline="")
+    output_format.write(rows(5700, 5737), serial)
+    parallel = io.StringIO(newline="")
+    write_parallel(output_format, 5700, 5737, parallel, workers=2, block_size=5)
+    assert parallel.getvalue() == serial.getvalue()
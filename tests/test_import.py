@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+IMPORT_TIME_LIMIT = 50_000
+"""The most time importing the package may take, in microseconds, including the modules it imports."""
+
+
+def _run(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_time():
+    """Test that importing the package stays fast."""
+    stderr = _run("import sefirat_haomer", "-X", "importtime").stderr
+    # Each line is "import time: <self> | <cumulative> | <indented module name>".
+    times = {
+        name.strip(): int(cumulative)
+        for _, cumulative, name in (
+            line.removeprefix("import time:").split("|")
+            for line in stderr.splitlines()[1:]
+        )
+    }
+    assert times["sefirat_haomer"] < IMPORT_TIME_LIMIT
+
+
+def test_lazy_imports():
+    """Test that pyluach and the package metadata are only loaded when needed, which for pyluach is only for years outside the precomputed table."""
+    code = (
+        "import sys\n"
+        "from datetime import date\n"
+        "import sefirat_haomer\n"
+        "print('pyluach' in sys.modules, '__version__' in vars(sefirat_haomer))\n"
+        "sefirat_haomer.OmerDate.from_gregorian(date(2023, 4, 14))\n"
+        "print('pyluach' in sys.modules, sefirat_haomer.__version__ is not None)\n"
+        "sefirat_haomer.OmerDate.from_gregorian(date(3500, 4, 14))\n"
+        "print('pyluach' in sys.modules)"
+    )
+    assert _run(code).stdout.split() == ["False", "False", "False", "True", "True"]
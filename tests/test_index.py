@@ -0,0 +1,62 @@
+from datetime import date
+
+import pytest
+from pyluach.dates import HebrewDate
+
+from sefirat_haomer import OmerDate, anchors, index
+
+
+@pytest.fixture
+def index_file(tmp_path):
+    path = tmp_path / "omer.idx"
+    index.write(path, 7000, 7100)
+    yield path
+    index.unload()
+
+
+def test_load(index_file):
+    """Test that the years of a loaded index are read from it rather than computed."""
+    for hebrew_year in range(7000, 7100):
+        anchors._anchors.pop(hebrew_year, None)
+    index.load(index_file)
+    for hebrew_year in range(7000, 7100):
+        expected = HebrewDate(hebrew_year, 1, 15).to_pydate().toordinal()
+        assert anchors.cached_pesach_ordinal(hebrew_year) == expected
+        assert anchors.pesach_ordinal(hebrew_year) == expected
+    assert not any(year in anchors._anchors for year in range(7000, 7100))
+
+
+def test_conversions(index_file):
+    """Test that conversions of dates in a loaded index are unchanged."""
+    gregorian = date(7050 - 3760, 5, 1)
+    expected = OmerDate.from_gregorian(gregorian)
+    index.load(index_file)
+    assert OmerDate.from_gregorian(gregorian) == expected
+    assert expected.gregorian == gregorian
+
+
+def test_file_size(index_file):
+    """Test that the file holds exactly a header and 4 bytes per year."""
+    assert index_file.stat().st_size == 12 + 4 * 100
+
+
+def test_reload(index_file):
+    """Test that loading an index replaces the previous one, and unloading removes it."""
+    index.load(index_file)
+    index.load(index_file)
+    assert anchors.cached_pesach_ordinal(7000) is not None
+    index.unload()
+    anchors._anchors.pop(7000, None)
+    assert anchors.cached_pesach_ordinal(7000) is None
+
+
+@pytest.mark.parametrize(
+    "content", [b"OMER", b"XXXX\0\0\0\0\0\0\0\0", b"OMER" + bytes(9)]
+)
+def test_invalid(tmp_path, content):
+    """Test that files which are not index files are rejected."""
+    path = tmp_path / "invalid.idx"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        index.load(path)
+    assert anchors._shared == (0, ())
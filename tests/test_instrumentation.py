@@ -0,0 +1,120 @@
+from datetime import date
+
+import pytest
+
+import sefirat_haomer
+from sefirat_haomer import OmerDate, anchors, instrumentation
+from sefirat_haomer.texts import HebrewText
+from sefirat_haomer.texts.text import Text
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+    OmerDate.disable_cache()
+
+
+def test_disabled():
+    """Test that nothing is counted and the original methods are used while disabled."""
+    original = Text.__dict__["text"]
+    OmerDate.from_gregorian(date(2023, 4, 14))
+    stats = sefirat_haomer.stats()
+    assert not stats.enabled
+    assert stats.operations == {}
+    assert Text.__dict__["text"] is original
+
+
+def test_operations():
+    """Test that every instrumented operation is counted and timed."""
+    instrumentation.enable()
+    omer_date = OmerDate.from_gregorian(date(2023, 4, 14))
+    omer_date.gregorian
+    omer_date.gregorian
+    omer_date.hebrew
+    HebrewText(8).text()
+    stats = sefirat_haomer.stats()
+    assert stats.enabled
+    assert {name: operation.calls for name, operation in stats.operations.items()} == {
+        "OmerDate.from_gregorian": 1,
+        "OmerDate.gregorian": 2,
+        "OmerDate.hebrew": 1,
+        "Text.text": 1,
+    }
+    for operation in stats.operations.values():
+        assert operation.total > 0
+        assert sum(operation.histogram) == operation.calls
+
+
+def test_results_unchanged():
+    """Test that instrumented operations return the same results."""
+    expected = OmerDate.from_gregorian(date(2023, 4, 14))
+    instrumentation.enable()
+    omer_date = OmerDate.from_gregorian(gregorian_date=date(2023, 4, 14))
+    assert omer_date == expected
+    assert omer_date.gregorian == date(2023, 4, 14)
+    assert omer_date.hebrew == expected.hebrew
+    assert HebrewText(8, vowels=True).text() == HebrewText._table(False, True)[7]
+    with pytest.raises(ValueError):
+        OmerDate.from_gregorian(date(2023, 1, 1))
+
+
+def test_disable_restores():
+    """Test that disabling restores the original methods and keeps the statistics."""
+    originals = {
+        name: OmerDate.__dict__[name]
+        for name in ("from_gregorian", "gregorian", "hebrew")
+    }
+    instrumentation.enable()
+    instrumentation.enable()
+    OmerDate.from_gregorian(date(2023, 4, 14))
+    instrumentation.disable()
+    assert {name: OmerDate.__dict__[name] for name in originals} == originals
+    assert sefirat_haomer.stats().operations["OmerDate.from_gregorian"].calls == 1
+
+
+def test_sink():
+    """Test that each timing is sent to the sink."""
+    received = []
+    instrumentation.enable(lambda name, seconds: received.append((name, seconds)))
+    HebrewText(1).text()
+    assert [name for name, _ in received] == ["Text.text"]
+    assert received[0][1] >= 0
+
+
+def test_anchor_cache():
+    """Test that lookups of years which were not yet computed count as misses."""
+    anchors._anchors.pop(7300, None)
+    instrumentation.enable()
+    OmerDate.from_gregorian(date(7300 - 3760, 5, 1))
+    OmerDate.from_gregorian(date(7300 - 3760, 5, 1))
+    OmerDate.from_gregorian(date(2023, 4, 14))
+    stats = sefirat_haomer.stats().caches["anchors"]
+    assert (stats.hits, stats.misses) == (2, 1)
+    assert stats.size == len(anchors._anchors)
+
+
+def test_text_cache():
+    """Test that texts whose table was not yet rendered count as misses."""
+
+    class CustomText(HebrewText):
+        LAOMER = "בעומר"
+
+    instrumentation.enable()
+    CustomText(1).text()
+    CustomText(2).text()
+    stats = sefirat_haomer.stats().caches["texts"]
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_omer_date_cache():
+    """Test that the hits and misses of the OmerDate cache are counted even while disabled."""
+    OmerDate.enable_cache()
+    OmerDate(1, hebrew_year=5783)
+    OmerDate(1, hebrew_year=5783)
+    OmerDate(2, hebrew_year=5783)
+    assert sefirat_haomer.stats().caches["omer_date"] == (1, 2, 2)
+    instrumentation.reset()
+    assert sefirat_haomer.stats().caches["omer_date"] == (0, 0, 2)
@@ -0,0 +1,95 @@
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from sefirat_haomer import OmerDate
+from sefirat_haomer.nightfall import SUNSET, Location, nightfall, omer_date_at
+
+JERUSALEM = Location(31.778, 35.235)
+NEW_YORK = Location(40.7128, -74.006)
+SVALBARD = Location(78.22, 15.65)
+
+
+@pytest.mark.parametrize(
+    "location, day, zone, expected",
+    [
+        (JERUSALEM, date(2023, 4, 14), "Asia/Jerusalem", datetime(2023, 4, 14, 19, 7)),
+        (
+            NEW_YORK,
+            date(2023, 6, 21),
+            "America/New_York",
+            datetime(2023, 6, 21, 20, 31),
+        ),
+    ],
+)
+def test_sunset(location: Location, day: date, zone: str, expected: datetime):
+    """Test that sunset is within a few minutes of published times."""
+    sunset = nightfall(location, day, SUNSET)
+    assert sunset is not None
+    local = sunset.astimezone(ZoneInfo(zone)).replace(tzinfo=None)
+    assert abs(local - expected) < timedelta(minutes=3)
+
+
+def test_nightfall_after_sunset():
+    """Test that nightfall is after sunset."""
+    sunset = nightfall(JERUSALEM, date(2023, 4, 14), SUNSET)
+    tzeit = nightfall(JERUSALEM, date(2023, 4, 14))
+    assert sunset is not None and tzeit is not None
+    assert timedelta(minutes=20) < tzeit - sunset < timedelta(minutes=60)
+
+
+def test_elevation():
+    """Test that the elevation only makes nightfall later when the correction is requested, whatever the depression."""
+    day = date(2023, 4, 14)
+    high = JERUSALEM._replace(elevation=800)
+    for depression in (SUNSET, 0.8333):
+        sunset = nightfall(JERUSALEM, day, depression)
+        high_sunset = nightfall(high, day, depression, elevation_correction=True)
+        assert sunset is not None and high_sunset is not None
+        assert timedelta(minutes=2) < high_sunset - sunset < timedelta(minutes=6)
+        assert nightfall(high, day, depression) == sunset
+    assert nightfall(high, day) == nightfall(JERUSALEM, day)
+
+
+def test_no_nightfall():
+    """Test that there is no nightfall during the midnight sun."""
+    assert nightfall(SVALBARD, date(2023, 6, 21)) is None
+
+
+def test_nightfall_cached():
+    """Test that repeated lookups are served from the cache."""
+    nightfall(JERUSALEM, date(2023, 4, 20))
+    hits = nightfall.cache_info().hits
+    nightfall(JERUSALEM, date(2023, 4, 20))
+    assert nightfall.cache_info().hits == hits + 1
+
+
+@pytest.mark.parametrize(
+    "location, when, expected",
+    [
+        (JERUSALEM, datetime(2023, 4, 14, 18, tzinfo=ZoneInfo("Asia/Jerusalem")), 8),
+        (JERUSALEM, datetime(2023, 4, 14, 21, tzinfo=ZoneInfo("Asia/Jerusalem")), 9),
+        (JERUSALEM, datetime(2023, 4, 15, 1, tzinfo=ZoneInfo("Asia/Jerusalem")), 9),
+        (JERUSALEM, datetime(2023, 4, 14, 21, tzinfo=timezone.utc), 9),
+        (NEW_YORK, datetime(2023, 4, 14, 18, tzinfo=timezone.utc), 8),
+        (NEW_YORK, datetime(2023, 4, 15, 2, tzinfo=timezone.utc), 9),
+    ],
+)
+def test_omer_date_at(location: Location, when: datetime, expected: int):
+    """Test that the count changes at nightfall, wherever the time is expressed."""
+    assert omer_date_at(when, location) == OmerDate(expected, hebrew_year=5783)
+
+
+def test_omer_date_at_outside_omer():
+    """Test that times outside the Omer resolve to None, including the night before the first day."""
+    evening = datetime(2023, 4, 5, 18, tzinfo=ZoneInfo("Asia/Jerusalem"))
+    assert omer_date_at(evening, JERUSALEM) is None
+    night = datetime(2023, 4, 6, 21, tzinfo=ZoneInfo("Asia/Jerusalem"))
+    assert omer_date_at(night, JERUSALEM) == OmerDate(1, hebrew_year=5783)
+
+
+def test_omer_date_at_naive():
+    """Test that naive datetimes are rejected."""
+    with pytest.raises(ValueError):
+        omer_date_at(datetime(2023, 4, 14, 18), JERUSALEM)
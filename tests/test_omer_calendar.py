@@ -1,6 +1,8 @@
+from datetime import date
+
 import pytest
 
-from sefirat_haomer import OmerCalendar, OmerDate
+from sefirat_haomer import OmerCalendar, OmerCalendarRange, OmerDate
 
 
 @pytest.fixture(params=[5783, 5784])
@@ -51,10 +53,10 @@ def test_get_item(omer_calendars: tuple[OmerCalendar, int], index: int, day: int
 def test_get_item_slice(omer_calendars: tuple[OmerCalendar, int], slc: slice):
     """Test that the OmerCalendar can be sliced."""
     omer_calendar, hebrew_year = omer_calendars
-    assert (
-        omer_calendar[slc]
-        == [OmerDate(i, hebrew_year=hebrew_year) for i in range(1, 50)][slc]
-    )
+    expected = [OmerDate(i, hebrew_year=hebrew_year) for i in range(1, 50)][slc]
+    assert list(omer_calendar[slc]) == expected
+    assert len(omer_calendar[slc]) == len(expected)
+    assert list(omer_calendar[slc][1:3]) == expected[1:3]
 
 
 def test_iter(omer_calendars: tuple[OmerCalendar, int]):
@@ -91,3 +93,34 @@ def test_contains(omer_calendars: tuple[OmerCalendar, int]):
     assert OmerDate(1, hebrew_year=hebrew_year) in omer_calendar
     assert OmerDate(49, hebrew_year=hebrew_year) in omer_calendar
     assert OmerDate(1, hebrew_year=hebrew_year + 1) not in omer_calendar
+
+
+@pytest.mark.parametrize("index", [49, -50])
+def test_get_item_out_of_range(omer_calendars: tuple[OmerCalendar, int], index: int):
+    """Test that indexing past either end raises an IndexError."""
+    omer_calendar, _ = omer_calendars
+    with pytest.raises(IndexError):
+        omer_calendar[index]
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        (date(2023, 4, 10), date(2023, 4, 20), OmerCalendar(hebrew_year=5783)[3:14]),
+        (date(2023, 1, 1), date(2024, 12, 31), OmerCalendarRange(5783, 5785)),
+        (date(2023, 6, 1), date(2024, 1, 1), OmerCalendarRange(5783, 5783)),
+        (date(2023, 4, 20), date(2023, 4, 10), OmerCalendarRange(5783, 5783)),
+    ],
+)
+def test_range_for(start, end, expected):
+    """Test that the range of Omer dates between two dates is computed directly."""
+    calendar_range = OmerCalendar.range_for(start, end)
+    assert list(calendar_range) == list(expected)
+    assert list(calendar_range) == list(OmerDate.between(start, end))
+
+
+def test_range_for_centuries():
+    """Test that a range spanning centuries is the same as the range of its years."""
+    assert OmerCalendar.range_for(date(1800, 1, 1), date(2199, 12, 31)) == (
+        OmerCalendarRange(1800 + 3760, 2200 + 3760)
+    )
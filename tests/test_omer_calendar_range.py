@@ -0,0 +1,110 @@
+from datetime import date
+
+import pytest
+from pyluach.dates import HebrewDate
+
+from sefirat_haomer import OmerCalendar, OmerCalendarRange, OmerDate
+
+
+@pytest.fixture
+def calendar_range() -> OmerCalendarRange:
+    return OmerCalendarRange(5780, 5790)
+
+
+def test_len(calendar_range: OmerCalendarRange):
+    """Test that the range has 49 dates per year."""
+    assert len(calendar_range) == 490
+    assert len(OmerCalendarRange(5790, 5780)) == 0
+
+
+def test_iter(calendar_range: OmerCalendarRange):
+    """Test that iterating over the range gives every calendar's dates in order."""
+    assert list(calendar_range) == [
+        omer_date
+        for year in range(5780, 5790)
+        for omer_date in OmerCalendar(hebrew_year=year)
+    ]
+
+
+@pytest.mark.parametrize(
+    "index, day, hebrew_year",
+    [(0, 1, 5780), (48, 49, 5780), (49, 1, 5781), (-1, 49, 5789), (-50, 49, 5788)],
+)
+def test_get_item(
+    calendar_range: OmerCalendarRange, index: int, day: int, hebrew_year: int
+):
+    """Test that the range can be indexed."""
+    assert calendar_range[index] == OmerDate(day, hebrew_year=hebrew_year)
+
+
+def test_get_item_out_of_range(calendar_range: OmerCalendarRange):
+    """Test that indexing past the end raises an IndexError."""
+    with pytest.raises(IndexError):
+        calendar_range[490]
+
+
+@pytest.mark.parametrize(
+    "slc",
+    [slice(None, 10), slice(40, 60), slice(None, None, 7), slice(None, None, -3)],
+)
+def test_get_item_slice(calendar_range: OmerCalendarRange, slc: slice):
+    """Test that slices are lazy ranges with the same elements as slicing a list."""
+    sliced = calendar_range[slc]
+    assert isinstance(sliced, OmerCalendarRange)
+    assert list(sliced) == list(calendar_range)[slc]
+    assert list(sliced[1:3]) == list(calendar_range)[slc][1:3]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        OmerDate(8, hebrew_year=5783),
+        date(2023, 4, 14),
+        HebrewDate(5783, 1, 23),
+    ],
+)
+def test_contains_and_index(calendar_range: OmerCalendarRange, value):
+    """Test that OmerDates, Gregorian dates and Hebrew dates can be found in the range."""
+    assert value in calendar_range
+    assert calendar_range.index(value) == 3 * 49 + 7
+    assert calendar_range.count(value) == 1
+    assert calendar_range[40:].index(value) == 3 * 49 + 7 - 40
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        OmerDate(8, hebrew_year=5790),
+        date(2023, 1, 1),
+        HebrewDate(5783, 1, 15),
+        "2023-04-14",
+    ],
+)
+def test_not_contains(calendar_range: OmerCalendarRange, value):
+    """Test that dates outside the range or outside the Omer are not found."""
+    assert value not in calendar_range
+    with pytest.raises(ValueError):
+        calendar_range.index(value)
+
+
+def test_reversed(calendar_range: OmerCalendarRange):
+    """Test that the range can be reversed."""
+    assert list(reversed(calendar_range)) == list(calendar_range)[::-1]
+
+
+def test_eq_and_hash(calendar_range: OmerCalendarRange):
+    """Test that ranges with the same dates are equal."""
+    assert calendar_range == OmerCalendarRange(5780, 5790)
+    assert hash(calendar_range) == hash(OmerCalendarRange(5780, 5790))
+    assert calendar_range != OmerCalendarRange(5780, 5791)
+    assert calendar_range[49:98] == OmerCalendarRange(5781, 5782)
+
+
+def test_repr(calendar_range: OmerCalendarRange):
+    """Test the representation of ranges and of views of them."""
+    assert repr(calendar_range) == "OmerCalendarRange(5780, 5790)"
+    assert repr(calendar_range[49:98]) == "OmerCalendarRange(5781, 5782)"
+    assert repr(calendar_range[1:3]) == (
+        "<OmerCalendarRange of 2 dates from OmerDate(2, hebrew_year=5780)"
+        " to OmerDate(3, hebrew_year=5780)>"
+    )
@@ -1,9 +1,11 @@
+import pickle
 from datetime import date
 
 import pytest
 from pyluach.dates import HebrewDate
 
 from sefirat_haomer import OmerDate, OmerDay
+from sefirat_haomer import omer_date as omer_date_module
 
 from .utils import tst_compare
 
@@ -176,3 +178,125 @@ def test_ge(omer_dates: tuple[OmerDate, HebrewDate, date]) -> None:
     if omer_date.day != 1:
         other = OmerDate(omer_date.day - 1, hebrew_year=hebrew_date.year)
         tst_compare(omer_date, other, lambda a, b: a >= b, match_itself=True)
+
+
+@pytest.mark.parametrize(
+    "hebrew_date",
+    [
+        HebrewDate(5783, 1, 15),
+        HebrewDate(5783, 3, 6),
+        HebrewDate(5783, 7, 1),
+        HebrewDate(5784, 13, 20),
+    ],
+)
+def test_from_hebrew_outside_omer(hebrew_date: HebrewDate) -> None:
+    """Test that Hebrew dates outside the Omer are rejected."""
+    with pytest.raises(ValueError):
+        OmerDate.from_hebrew(hebrew_date)
+
+
+@pytest.mark.parametrize("gregorian_year", [1, 1582, 2023, 2024, 2239])
+def test_from_gregorian_matches_pyluach(gregorian_year: int) -> None:
+    """Test that from_gregorian agrees with pyluach for every day of a Gregorian year."""
+    start = date(gregorian_year, 1, 1).toordinal()
+    for ordinal in range(start, date(gregorian_year, 12, 31).toordinal() + 1):
+        gregorian_date = date.fromordinal(ordinal)
+        hebrew_date = HebrewDate.from_pydate(gregorian_date)
+        day = int(hebrew_date.jd - HebrewDate(hebrew_date.year, 1, 15).jd)
+        if 1 <= day <= 49:
+            assert OmerDate.from_gregorian(gregorian_date) == OmerDate(
+                day, hebrew_year=hebrew_date.year
+            )
+        else:
+            with pytest.raises(ValueError):
+                OmerDate.from_gregorian(gregorian_date)
+
+
+def test_is_omer() -> None:
+    """Test that is_omer accepts exactly the dates of the Omer."""
+    assert OmerDate.is_omer(date(2023, 4, 7))
+    assert OmerDate.is_omer(date(2023, 5, 25))
+    assert not OmerDate.is_omer(date(2023, 4, 6))
+    assert not OmerDate.is_omer(date(2023, 5, 26))
+    assert not OmerDate.is_omer(date(2023, 1, 1))
+
+
+def test_try_from_gregorian(omer_dates: tuple[OmerDate, HebrewDate, date]) -> None:
+    """Test that try_from_gregorian returns the OmerDate, or None outside the Omer."""
+    omer_date, _, gregorian_date = omer_dates
+    assert OmerDate.try_from_gregorian(gregorian_date) == omer_date
+    assert OmerDate.try_from_gregorian(date(gregorian_date.year, 1, 1)) is None
+    assert OmerDate.try_from_gregorian(date(gregorian_date.year, 12, 31)) is None
+
+
+def test_filter_gregorian() -> None:
+    """Test that filter_gregorian yields only the dates during the Omer, in order."""
+    dates = [date(2023, 4, 5), date(2024, 5, 26), date(2023, 1, 1), date(2023, 4, 14)]
+    assert list(OmerDate.filter_gregorian(dates)) == [
+        OmerDate(33, hebrew_year=5784),
+        OmerDate(8, hebrew_year=5783),
+    ]
+
+
+def test_pickle(omer_dates: tuple[OmerDate, HebrewDate, date]) -> None:
+    """Test that an OmerDate survives pickling."""
+    omer_date, _, _ = omer_dates
+    assert pickle.loads(pickle.dumps(omer_date)) == omer_date
+
+
+def test_cache() -> None:
+    """Test that enabling the cache shares recently constructed instances."""
+    assert OmerDate(8, hebrew_year=5783) is not OmerDate(8, hebrew_year=5783)
+    OmerDate.enable_cache(maxsize=2)
+    try:
+        first = OmerDate(8, hebrew_year=5783)
+        assert OmerDate(8, gregorian_year=2023) is first
+        assert OmerDate.from_gregorian(date(2023, 4, 14)) is first
+        OmerDate(9, hebrew_year=5783)
+        OmerDate(10, hebrew_year=5783)
+        assert OmerDate(8, hebrew_year=5783) is not first
+    finally:
+        OmerDate.disable_cache()
+    assert OmerDate(8, hebrew_year=5783) is not OmerDate(8, hebrew_year=5783)
+
+
+def test_cache_hits_without_lock() -> None:
+    """Test that recently used dates are found in the cache without taking its lock."""
+    OmerDate.enable_cache()
+    try:
+        first = OmerDate(8, hebrew_year=5783)
+        cache = omer_date_module._cache
+        assert cache is not None
+        lock, cache.lock = cache.lock, None  # type: ignore[assignment]
+        try:
+            assert OmerDate(8, hebrew_year=5783) is first
+            assert OmerDate.from_gregorian(date(2023, 4, 14)) is first
+        finally:
+            cache.lock = lock
+    finally:
+        OmerDate.disable_cache()
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        (date(2023, 4, 10), date(2023, 4, 20)),
+        (date(2023, 1, 1), date(2023, 12, 31)),
+        (date(2023, 4, 7), date(2023, 4, 7)),
+        (date(2023, 4, 6), date(2023, 4, 6)),
+        (date(2023, 5, 20), date(2024, 5, 1)),
+        (date(2022, 6, 1), date(2025, 4, 20)),
+        (date(2023, 4, 20), date(2023, 4, 10)),
+    ],
+)
+def test_between(start: date, end: date):
+    """Test that the dates between two dates are those found by checking every day."""
+    days = (date.fromordinal(o) for o in range(start.toordinal(), end.toordinal() + 1))
+    assert list(OmerDate.between(start, end)) == list(OmerDate.filter_gregorian(days))
+
+
+def test_between_centuries():
+    """Test that a long interval yields every day of every year in it."""
+    omer_dates = OmerDate.between(date(1800, 1, 1), date(2199, 12, 31))
+    assert next(omer_dates) == OmerDate(1, gregorian_year=1800)
+    assert sum(1 for _ in omer_dates) == 400 * 49 - 1
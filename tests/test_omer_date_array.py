@@ -0,0 +1,74 @@
+from datetime import date, timedelta
+
+import pytest
+
+from sefirat_haomer import OmerDate, OmerDateArray
+
+
+@pytest.fixture
+def omer_dates() -> list[OmerDate]:
+    return [
+        OmerDate(33, hebrew_year=5784),
+        OmerDate(8, hebrew_year=5783),
+        OmerDate(49, hebrew_year=5783),
+        OmerDate(8, hebrew_year=5783),
+    ]
+
+
+def test_sequence(omer_dates: list[OmerDate]):
+    """Test that the array behaves like a list of the same dates."""
+    omer_date_array = OmerDateArray(omer_dates)
+    assert len(omer_date_array) == 4
+    assert list(omer_date_array) == omer_dates
+    assert omer_date_array[1] == omer_dates[1]
+    assert omer_date_array[-1] == omer_dates[-1]
+    assert list(omer_date_array[1:3]) == omer_dates[1:3]
+    assert OmerDate(49, hebrew_year=5783) in omer_date_array
+    assert OmerDate(1, hebrew_year=5783) not in omer_date_array
+    assert omer_date_array.index(OmerDate(49, hebrew_year=5783)) == 2
+    assert omer_date_array.count(OmerDate(8, hebrew_year=5783)) == 2
+
+
+def test_accessors(omer_dates: list[OmerDate]):
+    """Test that each accessor matches the attribute of each date."""
+    omer_date_array = OmerDateArray(omer_dates)
+    assert list(omer_date_array.day) == [d.day for d in omer_dates]
+    assert list(omer_date_array.weeks) == [d.weeks for d in omer_dates]
+    assert list(omer_date_array.days) == [d.days for d in omer_dates]
+    assert list(omer_date_array.hebrew_year) == [d.hebrew_year for d in omer_dates]
+    assert list(omer_date_array.ordinal) == [d.ordinal for d in omer_dates]
+    assert omer_date_array.gregorian == [d.gregorian for d in omer_dates]
+
+
+def test_sorted_and_unique(omer_dates: list[OmerDate]):
+    """Test sorting and deduplication."""
+    omer_date_array = OmerDateArray(omer_dates)
+    assert list(omer_date_array.sorted()) == sorted(omer_dates)
+    assert list(omer_date_array.sorted(reverse=True)) == sorted(omer_dates)[::-1]
+    assert list(omer_date_array.unique()) == sorted(set(omer_dates))
+
+
+def test_set_operations(omer_dates: list[OmerDate]):
+    """Test union, intersection and difference."""
+    first = OmerDateArray(omer_dates)
+    second = OmerDateArray(
+        [OmerDate(8, hebrew_year=5783), OmerDate(1, hebrew_year=5790)]
+    )
+    assert list(first | second) == sorted(set(omer_dates) | set(second))
+    assert list(first & second) == [OmerDate(8, hebrew_year=5783)]
+    assert list(first - second) == sorted(set(omer_dates) - set(second))
+
+
+def test_filter_gregorian():
+    """Test that only dates during the Omer are kept."""
+    start = date(2023, 1, 1)
+    gregorian_dates = [start + timedelta(days=i) for i in range(365)]
+    assert list(OmerDateArray.filter_gregorian(gregorian_dates)) == list(
+        OmerDate.filter_gregorian(gregorian_dates)
+    )
+
+
+def test_eq(omer_dates: list[OmerDate]):
+    """Test that arrays of the same dates in the same order are equal."""
+    assert OmerDateArray(omer_dates) == OmerDateArray(omer_dates)
+    assert OmerDateArray(omer_dates) != OmerDateArray(omer_dates[::-1])
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from sefirat_haomer import OmerDate, OmerDay
@@ -155,3 +157,79 @@ def test_ge(omer_day):
             (OmerDate(omer_day, hebrew_year=5783), omer_day),
         ),
     )
+
+
+def test_interned():
+    """Test that equal OmerDays are the same instance."""
+    assert OmerDay(33) is OmerDay(33)
+    assert OmerDay(OmerDay(33)) is OmerDay(33)
+    assert OmerDay(33) is not OmerDay(34)
+
+
+def test_subclass_init():
+    """Test that subclasses with their own __init__ can still call the base __init__."""
+
+    class LabelledDay(OmerDay):
+        __slots__ = ("label",)
+
+        def __init__(self, day, label):
+            super().__init__(day)
+            self.label = label
+
+    labelled = LabelledDay(33, "Lag BaOmer")
+    assert labelled.day == 33
+    assert labelled.label == "Lag BaOmer"
+    assert labelled is not LabelledDay(33, "Lag BaOmer")
+
+
+def test_pickle(omer_day):
+    """Test that pickling an OmerDay gives back the shared instance."""
+    omer_day, _, _ = omer_day
+    assert pickle.loads(pickle.dumps(omer_day)) is omer_day
+
+
+@pytest.mark.parametrize(
+    "day, hebrew, hebrew_vowels, transliteration, english",
+    [
+        (
+            1,
+            "חסד שבחסד",
+            "חֶסֶד שֶׁבְּחֶסֶד",
+            "Chesed she'be'Chesed",
+            "Kindness within Kindness",
+        ),
+        (
+            9,
+            "גבורה שבגבורה",
+            "גְּבוּרָה שֶׁבִּגְבוּרָה",
+            "Gevurah she'bi'Gevurah",
+            "Might within Might",
+        ),
+        (
+            33,
+            "הוד שבהוד",
+            "הוֹד שֶׁבְּהוֹד",
+            "Hod she'be'Hod",
+            "Splendor within Splendor",
+        ),
+        (
+            27,
+            "יסוד שבנצח",
+            "יְסוֹד שֶׁבְּנֶצַח",
+            "Yesod she'be'Netzach",
+            "Foundation within Victory",
+        ),
+    ],
+)
+def test_sefirah(day, hebrew, hebrew_vowels, transliteration, english):
+    """Test that each day has the right attribute in every form."""
+    sefirah = OmerDay(day).sefirah
+    assert sefirah.hebrew == hebrew
+    assert sefirah.hebrew_vowels == hebrew_vowels
+    assert sefirah.transliteration == transliteration
+    assert sefirah.english == english
+
+
+def test_sefirah_shared():
+    """Test that the attribute of a day is not rebuilt on each access."""
+    assert OmerDay(5).sefirah is OmerDate(5, hebrew_year=5783).sefirah
@@ -0,0 +1,85 @@
+import copy
+import pickle
+
+import pytest
+
+from sefirat_haomer import OmerCalendarRange, OmerDate, OmerDateArray
+from sefirat_haomer.packing import pack_many, unpack_many
+
+
+@pytest.mark.parametrize(
+    "omer_date",
+    [
+        OmerDate(1, hebrew_year=1),
+        OmerDate(8, hebrew_year=5783),
+        OmerDate(49, hebrew_year=9999),
+    ],
+)
+def test_to_int_round_trip(omer_date: OmerDate):
+    """Test that encoding and decoding gives back the same date."""
+    assert OmerDate.from_int(omer_date.to_int()) == omer_date
+
+
+def test_to_int_is_chronological():
+    """Test that encoded dates sort in chronological order."""
+    omer_dates = list(OmerCalendarRange(5780, 5790))
+    assert [d.to_int() for d in omer_dates] == sorted(d.to_int() for d in omer_dates)
+
+
+def test_pickle_size():
+    """Test that pickles use the packed encoding."""
+    omer_date = OmerDate(8, hebrew_year=5783)
+    assert pickle.loads(pickle.dumps(omer_date)) == omer_date
+    assert b"5783" not in pickle.dumps(omer_date, protocol=0)
+
+
+def test_pack_many():
+    """Test that dates are packed in 4 little-endian bytes each."""
+    packed = pack_many([OmerDate(1, hebrew_year=0), OmerDate(2, hebrew_year=1)])
+    assert packed == bytes([0, 0, 0, 0, 50, 0, 0, 0])
+
+
+@pytest.mark.parametrize(
+    "omer_dates",
+    [
+        list(OmerCalendarRange(5780, 5790)),
+        OmerDateArray(OmerCalendarRange(5780, 5790)),
+        [],
+    ],
+)
+def test_unpack_many(omer_dates):
+    """Test that unpacking gives back the packed dates, from lists or arrays."""
+    packed = pack_many(omer_dates)
+    assert len(packed) == 4 * len(omer_dates)
+    unpacked = unpack_many(packed)
+    assert list(unpacked) == list(omer_dates)
+    assert list(unpacked[5:10]) == list(omer_dates)[5:10]
+    if omer_dates:
+        assert omer_dates[3] in unpacked
+        assert list(unpacked.hebrew_year) == [d.hebrew_year for d in omer_dates]
+
+
+def test_unpack_many_zero_copy():
+    """Test that unpacking views the buffer instead of copying it."""
+    buffer = bytearray(pack_many([OmerDate(8, hebrew_year=5783)]))
+    unpacked = unpack_many(buffer)
+    buffer[:4] = pack_many([OmerDate(9, hebrew_year=5783)])
+    assert unpacked[0] == OmerDate(9, hebrew_year=5783)
+
+
+def test_unpack_many_pickle():
+    """Test that unpacked arrays can be pickled and copied, independently of their buffer."""
+    omer_dates = OmerDateArray(OmerCalendarRange(5783, 5785))
+    buffer = bytearray(pack_many(omer_dates))
+    unpacked = unpack_many(buffer)
+    pickled = pickle.loads(pickle.dumps(unpacked))
+    copied = copy.deepcopy(unpacked)
+    buffer[:4] = pack_many([OmerDate(9, hebrew_year=5783)])
+    assert pickled == copied == omer_dates
+    assert type(pickled) is OmerDateArray
+
+
+def test_unpack_many_invalid_length():
+    """Test that truncated buffers are rejected."""
+    with pytest.raises(ValueError):
+        unpack_many(b"\x00\x00\x00")
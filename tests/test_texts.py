@@ -1,6 +1,16 @@
+import unicodedata
+
 import pytest
 
-from sefirat_haomer.texts import EnglishText, HebrewText, PhoneticHebrewText
+from sefirat_haomer import OmerDay
+
+from sefirat_haomer.texts import (
+    EnglishText,
+    HebrewText,
+    Normalization,
+    PhoneticHebrewText,
+    strip_niqqud,
+)
 
 
 @pytest.mark.parametrize(
@@ -49,3 +59,112 @@ from sefirat_haomer.texts import EnglishText, HebrewText, PhoneticHebrewText
 def test_text(subclass, day, kwargs, expected):
     """Test that the Hebrew text is returned correctly."""
     assert subclass(day, **kwargs).text() == expected
+
+
+@pytest.mark.parametrize("subclass", [EnglishText, HebrewText, PhoneticHebrewText])
+def test_text_is_memoized(subclass):
+    """Test that rendering the same day twice reuses the same string."""
+    assert subclass(5).text() is subclass(5).text()
+
+
+def test_prebuild():
+    """Test that prebuild renders every combination of options for each class separately."""
+
+    class CustomText(HebrewText):
+        LAOMER = "בעומר"
+
+    CustomText.prebuild()
+    assert {options for options, _ in CustomText._tables} == {
+        (False, False),
+        (False, True),
+        (True, False),
+        (True, True),
+    }
+    assert CustomText(1).text() == "היום יום אחד בעומר:"
+    assert HebrewText(1).text() == "היום יום אחד לעמר:"
+
+
+def test_strip_niqqud():
+    """Test that vowels and cantillation are removed but Hebrew punctuation is kept."""
+    assert strip_niqqud("שָׁבוּעַ אֶחָד") == "שבוע אחד"
+    assert strip_niqqud("בְּנֵי־יִשְׂרָאֵל׃") == "בני־ישראל׃"
+
+
+@pytest.mark.parametrize(
+    "normalization, vowels, expected",
+    [
+        pytest.param(Normalization(), False, "היום יום אחד לעמר:", id="default"),
+        pytest.param(
+            Normalization(final_letters=False),
+            False,
+            "היומ יומ אחד לעמר:",
+            id="final_letters",
+        ),
+        pytest.param(
+            Normalization(rtl_marks=True),
+            False,
+            "\u2067היום יום אחד לעמר:\u2069",
+            id="rtl_marks",
+        ),
+        pytest.param(
+            Normalization("NFC"),
+            True,
+            unicodedata.normalize("NFC", "הַיּוֹם יוֹם אֶחָד לָעֹמֶר:"),
+            id="nfc",
+        ),
+        pytest.param(
+            Normalization("NFD"),
+            True,
+            unicodedata.normalize("NFD", "הַיּוֹם יוֹם אֶחָד לָעֹמֶר:"),
+            id="nfd",
+        ),
+    ],
+)
+def test_normalization(normalization, vowels, expected):
+    """Test that the normalization of a class is applied to its texts."""
+
+    class NormalizedText(HebrewText):
+        NORMALIZATION = normalization
+
+    assert NormalizedText(1, vowels=vowels).text() == expected
+    assert HebrewText(1).text() == "היום יום אחד לעמר:"
+
+
+def test_normalization_reassigned(monkeypatch):
+    """Test that reassigning the normalization of a class after rendering its texts takes effect."""
+    plain = HebrewText(8).text()
+    monkeypatch.setattr(HebrewText, "NORMALIZATION", Normalization(rtl_marks=True))
+    assert HebrewText(8).text() == f"\u2067{plain}\u2069"
+    monkeypatch.undo()
+    assert HebrewText(8).text() is plain
+
+
+@pytest.mark.parametrize(
+    "subclass, kwargs",
+    [
+        (EnglishText, {}),
+        (PhoneticHebrewText, {"laomer_at_end": True}),
+        (HebrewText, {}),
+        (HebrewText, {"laomer_at_end": True, "vowels": True}),
+    ],
+)
+def test_render_all(subclass, kwargs):
+    """Test that all the texts are rendered at once, the same as one by one."""
+    texts = subclass.render_all(**kwargs)
+    assert texts == tuple(subclass(day, **kwargs).text() for day in range(1, 50))
+    assert texts is subclass.render_all(**kwargs)
+
+
+def test_render_many():
+    """Test that many days are rendered in the order given."""
+    one, two = HebrewText(1, vowels=True).text(), HebrewText(2, vowels=True).text()
+    assert HebrewText.render_many([OmerDay(2), 1, 2], vowels=True) == [two, one, two]
+    assert EnglishText.render_many([]) == []
+
+
+@pytest.mark.parametrize("day", [0, -1, 50])
+@pytest.mark.parametrize("text_class", [HebrewText, EnglishText])
+def test_render_many_invalid(text_class, day):
+    """Test that days outside the Omer are rejected rather than wrapped around."""
+    with pytest.raises(ValueError, match="between 1 and 49"):
+        text_class.render_many([1, day])
@@ -0,0 +1,130 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pytest
+
+from sefirat_haomer import OmerCalendar, OmerDate, anchors, index
+from sefirat_haomer.texts import HebrewText
+
+THREADS = 8
+DATES = [date(2023, 3, 1) + timedelta(days=i) for i in range(120)]
+
+
+@pytest.fixture(autouse=True)
+def switch_often():
+    """Make threads switch as often as possible, so that races actually interleave on builds with a GIL."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def hammer(function, *args):
+    """Run a function from many threads at once, released together by a barrier, and return each thread's result."""
+    barrier = threading.Barrier(THREADS)
+
+    def run():
+        barrier.wait()
+        return function(*args)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        return [
+            future.result() for future in [executor.submit(run) for _ in range(THREADS)]
+        ]
+
+
+def convert(gregorian_dates):
+    return [
+        (omer_date, omer_date.gregorian, HebrewText(omer_date).text())
+        for omer_date in map(OmerDate.try_from_gregorian, gregorian_dates)
+        if omer_date is not None
+    ]
+
+
+def test_conversions():
+    """Test that conversions from many threads agree with a single thread."""
+    expected = convert(DATES)
+    assert hammer(convert, DATES) == [expected] * THREADS
+
+
+def test_uncached_years():
+    """Test that many threads computing the same uncached years agree on a single result."""
+    years = range(7400, 7410)
+    for year in years:
+        anchors._anchors.pop(year, None)
+    results = hammer(lambda: [anchors.pesach_ordinal(year) for year in years])
+    assert all(result == results[0] for result in results)
+    assert results[0] == [anchors._anchors[year] for year in years]
+
+
+def test_text_tables():
+    """Test that a table rendered for the first time from many threads is rendered once and shared."""
+
+    class CustomText(HebrewText):
+        LAOMER = "בעומר"
+
+    tables = hammer(CustomText.render_all, True, True)
+    assert all(table is tables[0] for table in tables)
+
+
+@pytest.mark.parametrize("maxsize", [1, 16, 4096])
+def test_omer_date_cache(maxsize):
+    """Test that the OmerDate cache stays consistent while many threads construct and evict dates."""
+    OmerDate.enable_cache(maxsize)
+    try:
+        results = hammer(
+            lambda: [
+                OmerDate(day, hebrew_year=year)
+                for _ in range(20)
+                for year in (5783, 5784, 5785)
+                for day in range(1, 50)
+            ]
+        )
+    finally:
+        OmerDate.disable_cache()
+    expected = [
+        OmerDate(day, hebrew_year=year)
+        for _ in range(20)
+        for year in (5783, 5784, 5785)
+        for day in range(1, 50)
+    ]
+    assert results == [expected] * THREADS
+
+
+def test_index_reload(tmp_path):
+    """Test that conversions stay correct while another thread keeps loading and unloading an index."""
+    path = tmp_path / "omer.idx"
+    index.write(path, 7000, 7100)
+    gregorian_dates = [date(7050 - 3760, 4, 1) + timedelta(days=i) for i in range(60)]
+    expected = convert(gregorian_dates)
+    stop = threading.Event()
+
+    def reload():
+        while not stop.is_set():
+            index.load(path)
+            index.unload()
+
+    reloader = threading.Thread(target=reload)
+    reloader.start()
+    try:
+        assert (
+            hammer(lambda: [convert(gregorian_dates) for _ in range(20)])
+            == [[expected] * 20] * THREADS
+        )
+    finally:
+        stop.set()
+        reloader.join()
+        index.unload()
+
+
+def test_calendars():
+    """Test that calendars iterated from many threads agree."""
+    expected = [list(OmerCalendar(hebrew_year=year)) for year in range(5780, 5790)]
+    assert (
+        hammer(
+            lambda: [list(OmerCalendar(hebrew_year=year)) for year in range(5780, 5790)]
+        )
+        == [expected] * THREADS
+    )
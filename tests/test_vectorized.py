@@ -0,0 +1,81 @@
+from datetime import date, timedelta
+
+import pytest
+
+from sefirat_haomer import OmerDate
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("sefirat_haomer.vectorized")
+
+
+def test_from_gregorian():
+    """Test that the vectorized conversion agrees with OmerDate.try_from_gregorian."""
+    start = date(2022, 1, 1)
+    gregorian_dates = [start + timedelta(days=i) for i in range(365 * 3)]
+    result = vectorized.from_gregorian(np.array(gregorian_dates, dtype="datetime64[D]"))
+    for i, gregorian_date in enumerate(gregorian_dates):
+        omer_date = OmerDate.try_from_gregorian(gregorian_date)
+        if omer_date is None:
+            assert result.day[i] == result.hebrew_year[i] == 0
+        else:
+            assert result.day[i] == omer_date.day
+            assert result.hebrew_year[i] == omer_date.hebrew_year
+            assert result.weeks[i] == omer_date.weeks
+            assert result.days[i] == omer_date.days
+    assert result.day.dtype == np.int8
+
+
+def test_from_gregorian_nat():
+    """Test that NaT is treated as a date outside the Omer."""
+    result = vectorized.from_gregorian(
+        np.array(["2023-04-14", "NaT"], dtype="datetime64[D]")
+    )
+    assert result.day.tolist() == [8, 0]
+    assert result.hebrew_year.tolist() == [5783, 0]
+
+
+def test_from_gregorian_empty():
+    """Test that an empty array converts to empty arrays."""
+    result = vectorized.from_gregorian(np.array([], dtype="datetime64[D]"))
+    assert result.day.shape == (0,)
+
+
+def test_from_gregorian_far_future():
+    """Test that Hebrew years beyond 16 bits aren't truncated."""
+    dates = np.array(["30000-05-01"], dtype="datetime64[D]") + np.arange(120)
+    result = vectorized.from_gregorian(dates)
+    in_omer = result.day != 0
+    assert in_omer.any()
+    assert (result.hebrew_year[in_omer] == 33760).all()
+    with pytest.raises(ValueError):
+        vectorized.from_gregorian(np.array(["5000000000-05-01"], dtype="datetime64[D]"))
+
+
+def test_distant_years_looked_up_once(monkeypatch):
+    """Test that each distinct year is looked up once, rather than every year in between."""
+    looked_up = []
+
+    def pesach_ordinal(hebrew_year):
+        looked_up.append(hebrew_year)
+        return OmerDate(1, hebrew_year=hebrew_year).gregorian.toordinal() - 1
+
+    monkeypatch.setattr(vectorized, "pesach_ordinal", pesach_ordinal)
+    dates = np.array(
+        [["2023-04-14", "8000-05-01"], ["2023-04-15", "2023-01-01"]],
+        dtype="datetime64[D]",
+    )
+    result = vectorized.from_gregorian(dates)
+    assert sorted(looked_up) == [5783, 11760]
+    assert result.day.tolist()[0][0] == 8 and result.day.tolist()[1] == [9, 0]
+
+
+def test_to_gregorian():
+    """Test that Hebrew years and Omer days convert back to the right dates."""
+    result = vectorized.to_gregorian([5783, 5783, 5784], [8, 49, 33])
+    assert result.tolist() == [date(2023, 4, 14), date(2023, 5, 25), date(2024, 5, 26)]
+
+
+def test_to_gregorian_invalid_day():
+    """Test that days outside the Omer are rejected."""
+    with pytest.raises(ValueError):
+        vectorized.to_gregorian([5783], [50])
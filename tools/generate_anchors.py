@@ -0,0 +1,62 @@
+"""Generate `sefirat_haomer/_anchor_table.py`, the precomputed date of Pesach of every year in a range.
+
+The table is checked in, so this only needs to be run again to change the range of years it covers:
+
+    $ python tools/generate_anchors.py --start 5000 --stop 7000
+"""
+
+import argparse
+from pathlib import Path
+
+from pyluach.dates import HebrewDate
+
+from sefirat_haomer.anchors import JD_OFFSET
+
+OUTPUT = Path(__file__).parent.parent / "sefirat_haomer" / "_anchor_table.py"
+PER_LINE = 8
+
+TEMPLATE = '''"""The ordinal of 15 Nisan of each Hebrew year from {start} to {last}.
+
+Generated by `tools/generate_anchors.py`. Do not edit.
+"""
+
+FIRST_YEAR = {start}
+"""The Hebrew year of the first element of `ORDINALS`."""
+
+# fmt: off
+ORDINALS = (
+{lines}
+)
+"""The proleptic Gregorian ordinal of 15 Nisan of each year, starting from `FIRST_YEAR`."""
+# fmt: on
+'''
+
+
+def generate(start: int, stop: int) -> str:
+    """Get the source of the table module.
+
+    Args:
+        start: The first Hebrew year of the table (inclusive).
+        stop: The last Hebrew year of the table (exclusive).
+    """
+    ordinals = [
+        int(HebrewDate(hebrew_year, 1, 15).jd - JD_OFFSET)
+        for hebrew_year in range(start, stop)
+    ]
+    lines = (
+        "    " + " ".join(f"{ordinal}," for ordinal in ordinals[i : i + PER_LINE])
+        for i in range(0, len(ordinals), PER_LINE)
+    )
+    return TEMPLATE.format(start=start, last=stop - 1, lines="\n".join(lines))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--start", type=int, default=5000)
+    parser.add_argument("--stop", type=int, default=7000)
+    args = parser.parse_args()
+    OUTPUT.write_text(generate(args.start, args.stop), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()